@@ -0,0 +1,20 @@
+"""
+Completion item type used when lsprotocol is not installed.
+
+Completion and snippet features return lsprotocol CompletionItem objects;
+without lsprotocol they return CompletionItemInfo, which exposes the same
+attribute names so callers handle a single shape.
+"""
+
+from typing import Any, NamedTuple
+
+
+class CompletionItemInfo(NamedTuple):
+    """Completion item without LSP types dependency."""
+
+    label: str
+    kind: Any = None
+    detail: str = ""
+    documentation: str = ""
+    insert_text: str | None = None
+    insert_text_format: int | None = None
@@ -0,0 +1,83 @@
+"""
+Cached scan of the CDL v2.0 constructs on a line.
+
+Diagnostics and document symbols both look for amorphous[sub]:{shapes}
+and for the nested growth (>) and aggregate (~ arrangement[N]) operators
+on the same stripped lines. parse_line scans a line once and caches the
+result by line text, so each unique line is scanned once across features
+and lines left untouched by an edit are not scanned again.
+"""
+
+import functools
+import re
+from typing import NamedTuple
+
+# amorphous[sub] with an optional :{shapes}
+_AMORPHOUS_RE = re.compile(r"amorphous\s*\[(\w+)\](?:\s*:\s*\{([^}]+)\})?", re.IGNORECASE)
+
+# Nested growth (>) or aggregate (~ arrangement[ with an optional N])
+_OPERATOR_RE = re.compile(r"(?P<nested>\s*>\s*)|~\s*(?P<arrangement>\w+)\s*\[(?:(?P<count>\d+)\])?")
+
+
+class Operator(NamedTuple):
+    """A nested growth or aggregate operator on a line."""
+
+    start: int
+    end: int
+    arrangement: str | None = None  # None for nested growth
+    arrangement_start: int = -1
+    count: str | None = None  # None unless written as ~ arrangement[N]
+    count_start: int = -1
+
+
+class ParsedLine(NamedTuple):
+    """CDL v2.0 constructs on a line, with their positions."""
+
+    subtype: str | None  # Subtype of the first amorphous[sub]
+    subtype_start: int
+    shapes: str | None  # Shapes of the first amorphous[sub]:{shapes}
+    shapes_start: int
+    operators: tuple[Operator, ...]
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_line(line: str) -> ParsedLine:
+    """
+    Scan a line for amorphous declarations and v2.0 operators.
+
+    Args:
+        line: Stripped line text
+
+    Returns:
+        ParsedLine with the constructs found (shared; do not modify)
+    """
+    subtype: str | None = None
+    subtype_start = -1
+    shapes: str | None = None
+    shapes_start = -1
+    for match in _AMORPHOUS_RE.finditer(line):
+        if subtype is None:
+            subtype = match.group(1)
+            subtype_start = match.start(1)
+        if match.group(2) is not None:
+            shapes = match.group(2)
+            shapes_start = match.start(2)
+            break
+
+    operators = []
+    for match in _OPERATOR_RE.finditer(line):
+        if match.group("nested") is not None:
+            operators.append(Operator(match.start(), match.end()))
+        else:
+            operators.append(
+                Operator(
+                    match.start(),
+                    match.end(),
+                    match.group("arrangement"),
+                    match.start("arrangement"),
+                    match.group("count"),
+                    match.start("count"),
+                )
+            )
+
+    return ParsedLine(subtype, subtype_start, shapes, shapes_start, tuple(operators))
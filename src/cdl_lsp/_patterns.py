@@ -0,0 +1,27 @@
+"""
+Regular expressions shared by the CDL feature modules.
+
+Named definitions (@name = expression) and $name references are
+recognized by definition, completion and document symbols; keeping the
+patterns here compiles each one once and keeps the features in agreement.
+"""
+
+import re
+import string
+
+# CDL definition names are ASCII identifiers
+_NAME = r"[A-Za-z0-9_]+"
+
+# Characters allowed in a definition or reference name
+NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+# Pattern for named definitions on a stripped line: @name = expression
+DEFINITION_LINE_PATTERN = re.compile(rf"^@({_NAME})\s*=\s*(.+)$")
+
+# DEFINITION_LINE_PATTERN applied to a whole document, one (indented) line at a time
+DOCUMENT_DEFINITION_PATTERN = re.compile(
+    rf"^[^\S\n]*@({_NAME})[^\S\n]*=[^\S\n]*(.*\S)[^\S\n]*$", re.MULTILINE
+)
+
+# Pattern for references: $name
+REFERENCE_PATTERN = re.compile(rf"\$({_NAME})")
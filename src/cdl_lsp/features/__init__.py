@@ -18,7 +18,12 @@ This package contains the individual feature modules:
 from .code_actions import get_code_action_kinds, get_code_actions
 from .completion import get_completions
 from .definition import find_document_definitions, get_definition
-from .diagnostics import DiagnosticInfo, get_diagnostics, validate_document
+from .diagnostics import (
+    DiagnosticInfo,
+    get_diagnostics,
+    validate_changed_lines,
+    validate_document,
+)
 from .document_symbols import get_document_symbols
 from .explain import explain_cdl, get_explain_result
 from .formatting import format_cdl, format_line, format_range
@@ -30,6 +35,7 @@ from .snippets import get_preset_snippets, get_snippet_for_preset, list_preset_n
 __all__ = [
     # Diagnostics
     "validate_document",
+    "validate_changed_lines",
     "get_diagnostics",
     "DiagnosticInfo",
     # Completion
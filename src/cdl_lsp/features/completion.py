@@ -5,6 +5,8 @@ This module provides intelligent completions based on the current
 cursor position and context within the CDL syntax.
 """
 
+import bisect
+import functools
 import re
 from enum import Enum, auto
 from typing import Any
@@ -14,6 +16,8 @@ try:
 except ImportError:
     types = None
 
+from .._items import CompletionItemInfo
+from .._patterns import DOCUMENT_DEFINITION_PATTERN
 from ..constants import (
     AGGREGATE_ARRANGEMENT_DOCS,
     AGGREGATE_ARRANGEMENTS,
@@ -70,10 +74,117 @@ class CompletionContext(Enum):
     UNKNOWN = auto()
 
 
+def _word_start(text: str, end: int) -> int:
+    """Return where the run of word characters ending at ``end`` begins."""
+    while end and (text[end - 1].isalnum() or text[end - 1] == "_"):
+        end -= 1
+    return end
+
+
+def _space_start(text: str, end: int) -> int:
+    """Return where the run of whitespace ending at ``end`` begins."""
+    while end and text[end - 1].isspace():
+        end -= 1
+    return end
+
+
+def _follows_amorphous(text: str, end: int) -> bool:
+    """Check whether ``amorphous`` (any case) ends at ``end``, ignoring whitespace."""
+    end = _space_start(text, end)
+    return end >= 9 and text[end - 9 : end].casefold() == "amorphous"
+
+
+def _opens_amorphous_shapes(text: str, brace: int) -> bool:
+    """Check whether the ``{`` at ``brace`` follows ``amorphous[sub]:``."""
+    i = _space_start(text, brace)
+    if not i or text[i - 1] != ":":
+        return False
+    i = _space_start(text, i - 1)
+    if not i or text[i - 1] != "]":
+        return False
+    start = _word_start(text, i - 1)
+    if start == i - 1 or not start or text[start - 1] != "[":
+        return False
+    return _follows_amorphous(text, start - 1)
+
+
+def _opens_orientation(text: str, end: int) -> bool:
+    """Check whether ``~ arrangement[N]`` (with optional ``@scale``) ends at ``end``."""
+    if not end:
+        return False
+    if text[end - 1] != "]":
+        # Optional @scale between the count and the orientation bracket
+        start = end
+        while start and (text[start - 1].isalnum() or text[start - 1] in "_."):
+            start -= 1
+        if start == end or not start or text[start - 1] != "@":
+            return False
+        end = _space_start(text, start - 1)
+        if not end or text[end - 1] != "]":
+            return False
+    count_end = end - 1
+    start = count_end
+    while start and text[start - 1].isdecimal():
+        start -= 1
+    if start == count_end or not start or text[start - 1] != "[":
+        return False
+    end = _space_start(text, start - 1)
+    start = _word_start(text, end)
+    if start == end:
+        return False
+    start = _space_start(text, start)
+    return bool(start) and text[start - 1] == "~"
+
+
+def _detect_v2_context(text_before: str) -> tuple[CompletionContext, str] | None:
+    """
+    Detect the CDL v2.0 amorphous and aggregate contexts.
+
+    Only the word being typed and the few tokens before it decide these
+    contexts, so they are read by walking back from the cursor instead of
+    matching patterns against the whole line.
+
+    Args:
+        text_before: Line text before the cursor
+
+    Returns:
+        Tuple of (context, current_word), or None if no v2.0 context applies
+    """
+    word_start = _word_start(text_before, len(text_before))
+    word = text_before[word_start:]
+    i = _space_start(text_before, word_start)
+    opens_bracket = bool(i) and text_before[i - 1] == "["
+
+    # Amorphous subtype — amorphous[
+    if opens_bracket and _follows_amorphous(text_before, i - 1):
+        return (CompletionContext.AMORPHOUS_SUBTYPE, word)
+
+    # Amorphous shape — amorphous[sub]:{ with the braces still open
+    brace = text_before.find("{", text_before.rfind("}") + 1)
+    while brace != -1:
+        if _opens_amorphous_shapes(text_before, brace):
+            return (CompletionContext.AMORPHOUS_SHAPE, word)
+        brace = text_before.find("{", brace + 1)
+
+    # Aggregate orientation — ~ arr[N] [
+    if opens_bracket and _opens_orientation(text_before, _space_start(text_before, i - 1)):
+        return (CompletionContext.AGGREGATE_ORIENTATION, word)
+
+    # Arrangement type — after ~
+    if i and text_before[i - 1] == "~":
+        return (CompletionContext.ARRANGEMENT_TYPE, word)
+
+    return None
+
+
+@functools.lru_cache(maxsize=256)
 def _detect_context(line: str, col: int) -> tuple[CompletionContext, str]:
     """
     Detect the completion context based on cursor position.
 
+    Cached on (line, col): editors re-query completion at the same cursor
+    repeatedly, and the result depends only on the line text.
+
     Args:
         line: Current line text
         col: Column position (0-based)
@@ -92,29 +203,10 @@ def _detect_context(line: str, col: int) -> tuple[CompletionContext, str]:
     if not text_before_stripped:
         return (CompletionContext.EMPTY, current_word)
 
-    # CDL v2.0: Amorphous subtype — amorphous[
-    amor_sub_match = re.search(r"amorphous\s*\[\s*(\w*)$", text_before, re.IGNORECASE)
-    if amor_sub_match:
-        return (CompletionContext.AMORPHOUS_SUBTYPE, amor_sub_match.group(1))
-
-    # CDL v2.0: Amorphous shape — amorphous[sub]:{
-    amor_shape_match = re.search(
-        r"amorphous\s*\[\w+\]\s*:\s*\{[^}]*?(\w*)$", text_before, re.IGNORECASE
-    )
-    if amor_shape_match:
-        return (CompletionContext.AMORPHOUS_SHAPE, amor_shape_match.group(1))
-
-    # CDL v2.0: Aggregate orientation — ~ arr[N] [
-    orient_match = re.search(
-        r"~\s*\w+\s*\[\d+\]\s*(?:@[\w.]+\s*)?\[\s*(\w*)$", text_before, re.IGNORECASE
-    )
-    if orient_match:
-        return (CompletionContext.AGGREGATE_ORIENTATION, orient_match.group(1))
-
-    # CDL v2.0: Arrangement type — after ~
-    arr_match = re.search(r"~\s*(\w*)$", text_before)
-    if arr_match:
-        return (CompletionContext.ARRANGEMENT_TYPE, arr_match.group(1))
+    # CDL v2.0 contexts are recognized by scanning back from the cursor
+    v2_context = _detect_v2_context(text_before)
+    if v2_context is not None:
+        return v2_context
 
     # After $ - reference to a named definition
     ref_match = re.search(r"\$(\w*)$", text_before)
@@ -214,24 +306,27 @@ def _get_system_from_line(line: str) -> str | None:
     return None
 
 
-def _create_completion_item(
+def _create_completion_item_plain(
     label: str,
     kind: Any = None,
     detail: str = "",
     documentation: str = "",
     insert_text: str | None = None,
     sort_text: str | None = None,
-) -> Any:
-    """Create a completion item."""
-    if types is None:
-        return {
-            "label": label,
-            "kind": kind,
-            "detail": detail,
-            "documentation": documentation,
-            "insert_text": insert_text or label,
-        }
+) -> CompletionItemInfo:
+    """Create a completion item without LSP types."""
+    return CompletionItemInfo(label, kind, detail, documentation, insert_text or label)
 
+
+def _create_completion_item_lsp(
+    label: str,
+    kind: Any = None,
+    detail: str = "",
+    documentation: str = "",
+    insert_text: str | None = None,
+    sort_text: str | None = None,
+) -> Any:
+    """Create an LSP CompletionItem."""
     return types.CompletionItem(
         label=label,
         kind=kind or types.CompletionItemKind.Keyword,
@@ -244,6 +339,12 @@ def _create_completion_item(
     )
 
 
+# Create a completion item of the one concrete type available
+_create_completion_item = (
+    _create_completion_item_plain if types is None else _create_completion_item_lsp
+)
+
+
 def _find_definitions_in_text(document_text: str) -> list[tuple[str, str]]:
     """
     Find all @name = expression definitions in document text.
@@ -254,12 +355,237 @@ def _find_definitions_in_text(document_text: str) -> list[tuple[str, str]]:
     Returns:
         List of (name, expression) tuples
     """
-    definitions = []
-    for doc_line in document_text.split("\n"):
-        match = re.match(r"^\s*@(\w+)\s*=\s*(.+)$", doc_line)
-        if match:
-            definitions.append((match.group(1), match.group(2).strip()))
-    return definitions
+    return [
+        (match.group(1), match.group(2))
+        for match in DOCUMENT_DEFINITION_PATTERN.finditer(document_text)
+    ]
+
+
+def _kind(name: str) -> Any:
+    """Return the completion item kind called ``name``."""
+    return getattr(types.CompletionItemKind, name) if types else name
+
+
+# Vocabularies longer than this are filtered by bisecting their sorted labels
+_BISECT_MIN_ITEMS = 10
+
+
+def _label_index(items: list[Any]) -> list[str] | None:
+    """Return the labels of ``items`` if they are long and sorted enough to bisect."""
+    labels = [item.label for item in items]
+    if len(labels) > _BISECT_MIN_ITEMS and labels == sorted(labels):
+        return labels
+    return None
+
+
+def _filter_items(items: list[Any], prefix: str, labels: list[str] | None = None) -> list[Any]:
+    """
+    Return the items whose label starts with ``prefix`` (all of them if empty).
+
+    Args:
+        items: Completion items
+        prefix: Typed prefix to match
+        labels: Sorted labels of ``items`` from _label_index, if available
+
+    Returns:
+        Matching items, in their original order
+    """
+    if not prefix:
+        return items
+    if labels is None:
+        return [item for item in items if item.label.startswith(prefix)]
+
+    # Matches are contiguous in the sorted labels
+    start = end = bisect.bisect_left(labels, prefix)
+    while end < len(labels) and labels[end].startswith(prefix):
+        end += 1
+    return items[start:end]
+
+
+# Completion items for fixed vocabularies are built once at import and
+# shared between requests; get_completions filters them by the typed word.
+
+_SYSTEM_ITEMS = [
+    _create_completion_item(
+        label=system,
+        kind=_kind("Keyword"),
+        detail=f"Crystal system (default: {DEFAULT_POINT_GROUPS[system]})",
+        documentation=SYSTEM_DOCS.get(system, ""),
+        insert_text=f"{system}[{DEFAULT_POINT_GROUPS[system]}]:",
+        sort_text="0" + system,  # Systems first
+    )
+    for system in sorted(CRYSTAL_SYSTEMS)
+]
+
+# CDL v2.0: 'amorphous' is suggested alongside crystal systems
+_EMPTY_LINE_ITEMS = [
+    *_SYSTEM_ITEMS,
+    _create_completion_item(
+        label="amorphous",
+        kind=_kind("Keyword"),
+        detail="Amorphous material (CDL v2.0)",
+        documentation=(
+            "**Amorphous Material**\n\n"
+            "For materials without crystalline structure.\n\n"
+            "Syntax: `amorphous[subtype]:{shape1, shape2}`\n\n"
+            "Examples: opal, obsidian, amber, chalcedony"
+        ),
+        insert_text="amorphous[",
+        sort_text="0amorphous",
+    ),
+]
+
+_FORM_ITEMS = [
+    _create_completion_item(
+        label=form_name,
+        kind=_kind("Value"),
+        detail=f"{{{miller[0]}{miller[1]}{miller[2]}}}",
+        documentation=FORM_DOCS.get(form_name, ""),
+    )
+    for form_name, miller in sorted(NAMED_FORMS.items())
+]
+
+_FORM_LABELS = _label_index(_FORM_ITEMS)
+
+_MILLER_START_ITEM = _create_completion_item(
+    label="{",
+    kind=_kind("Snippet"),
+    detail="Miller index",
+    documentation="Enter a Miller index like {111}, {100}, or {10-10}",
+    insert_text="{",
+)
+
+_SCALE_ITEMS = [
+    _create_completion_item(
+        label=scale,
+        kind=_kind("Value"),
+        detail="Scale factor",
+        documentation=f"Scale the form by {scale}",
+    )
+    for scale in COMMON_SCALES
+]
+
+_DEFINITION_START_ITEMS = [
+    _create_completion_item(
+        label="name = expression",
+        kind=_kind("Snippet"),
+        detail="Named definition",
+        documentation=(
+            "Define a named CDL expression that can be referenced with `$name`.\n\n"
+            "Example:\n```\n@prism = {10-10}@1.0\n@body = $prism + {10-11}@0.8\n```"
+        ),
+        insert_text="name = ",
+        sort_text="0",
+    )
+]
+
+
+def _axis_items(verb: str) -> list[Any]:
+    """Build the axis parameter items for a modification."""
+    return [
+        _create_completion_item(
+            label=f"{axis}:",
+            kind=_kind("Property"),
+            detail="Axis parameter",
+            documentation=f"{verb} along {axis}-axis",
+        )
+        for axis in ["a", "b", "c"]
+    ]
+
+
+# Parameter items per modification; taper and bevel have none
+_MODIFICATION_PARAM_ITEMS = {
+    "elongate": _axis_items("Elongate"),
+    "truncate": [
+        _create_completion_item(
+            label=f"{form_name}:",
+            kind=_kind("Value"),
+            detail=f"{{{miller[0]}{miller[1]}{miller[2]}}}",
+        )
+        for form_name, miller in sorted(NAMED_FORMS.items())
+    ],
+    "taper": [],
+    "bevel": [],
+    "flatten": _axis_items("Flatten"),
+}
+
+
+def _vocabulary_items(
+    names: Any, kind: str, detail: str, docs: dict[str, str], insert_suffix: str
+) -> list[Any]:
+    """Build sorted items for a vocabulary whose insert text adds a closing token."""
+    return [
+        _create_completion_item(
+            label=name,
+            kind=_kind(kind),
+            detail=detail,
+            documentation=docs.get(name, ""),
+            insert_text=f"{name}{insert_suffix}",
+        )
+        for name in sorted(names)
+    ]
+
+
+# Items offered in each context, filtered by the word being typed
+_ITEMS_BY_CTX: dict[CompletionContext, list[Any]] = {
+    CompletionContext.AFTER_PIPE: [
+        *(
+            _create_completion_item(
+                label=mod,
+                kind=_kind("Function"),
+                detail="Modification" if mod != "twin" else "Twin operation",
+                documentation=MODIFICATION_DOCS.get(mod, ""),
+                insert_text=f"{mod}(",
+            )
+            for mod in sorted(MODIFICATIONS)
+        ),
+        # Add phenomenon as an option after pipe
+        _create_completion_item(
+            label="phenomenon",
+            kind=_kind("Function"),
+            detail="Optical phenomenon",
+            documentation="Specify an optical phenomenon like asterism, chatoyancy, etc.",
+            insert_text="phenomenon[",
+        ),
+    ],
+    CompletionContext.TWIN_LAW: _vocabulary_items(
+        TWIN_LAWS, "EnumMember", "Twin law", TWIN_LAW_DOCS, ")"
+    ),
+    CompletionContext.FEATURE_NAME: _vocabulary_items(
+        FEATURE_NAMES, "Property", "Feature", FEATURE_DOCS, ":"
+    ),
+    CompletionContext.PHENOMENON_TYPE: _vocabulary_items(
+        PHENOMENON_TYPES, "EnumMember", "Optical phenomenon", PHENOMENON_DOCS, ":"
+    ),
+    CompletionContext.AMORPHOUS_SUBTYPE: _vocabulary_items(
+        AMORPHOUS_SUBTYPES, "EnumMember", "Amorphous subtype", AMORPHOUS_SUBTYPE_DOCS, "]:"
+    ),
+    CompletionContext.AMORPHOUS_SHAPE: [
+        _create_completion_item(
+            label=shape,
+            kind=_kind("Value"),
+            detail="Shape descriptor",
+            documentation=AMORPHOUS_SHAPE_DOCS.get(shape, ""),
+        )
+        for shape in sorted(AMORPHOUS_SHAPES)
+    ],
+    CompletionContext.ARRANGEMENT_TYPE: _vocabulary_items(
+        AGGREGATE_ARRANGEMENTS,
+        "EnumMember",
+        "Aggregate arrangement",
+        AGGREGATE_ARRANGEMENT_DOCS,
+        "[",
+    ),
+    CompletionContext.AGGREGATE_ORIENTATION: _vocabulary_items(
+        AGGREGATE_ORIENTATIONS,
+        "EnumMember",
+        "Aggregate orientation",
+        AGGREGATE_ORIENTATION_DOCS,
+        "]",
+    ),
+}
+
+_LABELS_BY_CTX = {context: _label_index(items) for context, items in _ITEMS_BY_CTX.items()}
 
 
 def get_completions(
@@ -271,6 +597,9 @@ def get_completions(
     """
     Get completion items for the current position.
 
+    Items for fixed vocabularies are shared between calls, so the returned
+    list and its items must not be modified.
+
     Args:
         line: Current line text
         col: Column position (0-based)
@@ -281,77 +610,25 @@ def get_completions(
         List of completion items
     """
     context, current_word = _detect_context(line, col)
-    items: list[Any] = []
+    prefix = current_word.lower()
 
-    kind = types.CompletionItemKind if types else None
+    vocabulary = _ITEMS_BY_CTX.get(context)
+    if vocabulary is not None:
+        return _filter_items(vocabulary, prefix, _LABELS_BY_CTX[context])
 
-    if context == CompletionContext.EMPTY:
-        # Filter by current word if user is typing something
-        prefix = current_word.lower() if current_word else ""
-
-        # Suggest crystal systems (filtered by prefix if applicable)
-        for system in sorted(CRYSTAL_SYSTEMS):
-            if prefix and not system.startswith(prefix):
-                continue
-            doc = SYSTEM_DOCS.get(system, "")
-            items.append(
-                _create_completion_item(
-                    label=system,
-                    kind=kind.Keyword if kind else "Keyword",
-                    detail=f"Crystal system (default: {DEFAULT_POINT_GROUPS[system]})",
-                    documentation=doc,
-                    insert_text=f"{system}[{DEFAULT_POINT_GROUPS[system]}]:",
-                    sort_text="0" + system,  # Systems first
-                )
-            )
-
-        # CDL v2.0: Suggest 'amorphous' alongside crystal systems
-        if not prefix or "amorphous".startswith(prefix):
-            items.append(
-                _create_completion_item(
-                    label="amorphous",
-                    kind=kind.Keyword if kind else "Keyword",
-                    detail="Amorphous material (CDL v2.0)",
-                    documentation=(
-                        "**Amorphous Material**\n\n"
-                        "For materials without crystalline structure.\n\n"
-                        "Syntax: `amorphous[subtype]:{shape1, shape2}`\n\n"
-                        "Examples: opal, obsidian, amber, chalcedony"
-                    ),
-                    insert_text="amorphous[",
-                    sort_text="0amorphous",
-                )
-            )
+    items: list[Any] = []
 
-        # Suggest preset snippets (filtered by prefix) - these expand to full CDL
-        snippets = get_preset_snippets(prefix)
-        items.extend(snippets)
+    if context == CompletionContext.EMPTY:
+        # Crystal systems and amorphous, then preset snippets that expand to full CDL
+        items = _filter_items(_EMPTY_LINE_ITEMS, prefix) + get_preset_snippets(prefix)
 
     elif context == CompletionContext.SYSTEM:
-        # Suggest crystal systems matching prefix
-        prefix = current_word.lower()
-        for system in sorted(CRYSTAL_SYSTEMS):
-            if system.startswith(prefix):
-                doc = SYSTEM_DOCS.get(system, "")
-                items.append(
-                    _create_completion_item(
-                        label=system,
-                        kind=kind.Keyword if kind else "Keyword",
-                        detail=f"Crystal system (default: {DEFAULT_POINT_GROUPS[system]})",
-                        documentation=doc,
-                        insert_text=f"{system}[{DEFAULT_POINT_GROUPS[system]}]:",
-                        sort_text="0" + system,  # Systems first
-                    )
-                )
-
-        # Also suggest matching preset snippets
-        snippets = get_preset_snippets(prefix)
-        items.extend(snippets)
+        # Crystal systems matching prefix, and matching preset snippets
+        items = _filter_items(_SYSTEM_ITEMS, prefix) + get_preset_snippets(prefix)
 
     elif context == CompletionContext.POINT_GROUP:
         # Suggest point groups for the current system
         system = _get_system_from_line(line)
-        prefix = current_word.lower()
 
         if system and system in POINT_GROUPS:
             groups = POINT_GROUPS[system]
@@ -369,7 +646,7 @@ def get_completions(
                 items.append(
                     _create_completion_item(
                         label=pg,
-                        kind=kind.EnumMember if kind else "EnumMember",
+                        kind=_kind("EnumMember"),
                         detail=detail,
                         documentation=doc,
                         sort_text="0" + pg if is_default else "1" + pg,
@@ -381,33 +658,8 @@ def get_completions(
         CompletionContext.AFTER_PLUS,
         CompletionContext.FORM_NAME,
     ):
-        # Suggest named forms and Miller index start
-        prefix = current_word.lower()
-
-        # Named forms
-        for form_name in sorted(NAMED_FORMS.keys()):
-            if form_name.startswith(prefix) or not prefix:
-                miller = NAMED_FORMS[form_name]
-                doc = FORM_DOCS.get(form_name, "")
-                items.append(
-                    _create_completion_item(
-                        label=form_name,
-                        kind=kind.Value if kind else "Value",
-                        detail=f"{{{miller[0]}{miller[1]}{miller[2]}}}",
-                        documentation=doc,
-                    )
-                )
-
-        # Miller index start
-        items.append(
-            _create_completion_item(
-                label="{",
-                kind=kind.Snippet if kind else "Snippet",
-                detail="Miller index",
-                documentation="Enter a Miller index like {111}, {100}, or {10-10}",
-                insert_text="{",
-            )
-        )
+        # Named forms and Miller index start
+        items = [*_filter_items(_FORM_ITEMS, prefix, _FORM_LABELS), _MILLER_START_ITEM]
 
     elif context == CompletionContext.MILLER_INDEX:
         # Suggest common Miller indices for the current system
@@ -420,7 +672,7 @@ def get_completions(
             items.append(
                 _create_completion_item(
                     label=idx,
-                    kind=kind.Value if kind else "Value",
+                    kind=_kind("Value"),
                     detail="Miller index",
                     insert_text=inner + "}",
                 )
@@ -428,140 +680,25 @@ def get_completions(
 
     elif context == CompletionContext.AFTER_AT:
         # Suggest common scale values
-        for scale in COMMON_SCALES:
-            items.append(
-                _create_completion_item(
-                    label=scale,
-                    kind=kind.Value if kind else "Value",
-                    detail="Scale factor",
-                    documentation=f"Scale the form by {scale}",
-                )
-            )
-
-    elif context == CompletionContext.AFTER_PIPE:
-        # Suggest modifications, twin, and phenomenon
-        prefix = current_word.lower()
-
-        for mod in sorted(MODIFICATIONS):
-            if mod.startswith(prefix) or not prefix:
-                doc = MODIFICATION_DOCS.get(mod, "")
-                items.append(
-                    _create_completion_item(
-                        label=mod,
-                        kind=kind.Function if kind else "Function",
-                        detail="Modification" if mod != "twin" else "Twin operation",
-                        documentation=doc,
-                        insert_text=f"{mod}(",
-                    )
-                )
-
-        # Add phenomenon as an option after pipe
-        if "phenomenon".startswith(prefix) or not prefix:
-            items.append(
-                _create_completion_item(
-                    label="phenomenon",
-                    kind=kind.Function if kind else "Function",
-                    detail="Optical phenomenon",
-                    documentation="Specify an optical phenomenon like asterism, chatoyancy, etc.",
-                    insert_text="phenomenon[",
-                )
-            )
-
-    elif context == CompletionContext.TWIN_LAW:
-        # Suggest twin laws
-        prefix = current_word.lower()
-
-        for law in sorted(TWIN_LAWS):
-            if law.startswith(prefix) or not prefix:
-                doc = TWIN_LAW_DOCS.get(law, "")
-                items.append(
-                    _create_completion_item(
-                        label=law,
-                        kind=kind.EnumMember if kind else "EnumMember",
-                        detail="Twin law",
-                        documentation=doc,
-                        insert_text=f"{law})",
-                    )
-                )
-
-    elif context == CompletionContext.FEATURE_NAME:
-        prefix = current_word.lower()
-        for feat in sorted(FEATURE_NAMES):
-            if feat.startswith(prefix) or not prefix:
-                doc = FEATURE_DOCS.get(feat, "")
-                items.append(
-                    _create_completion_item(
-                        label=feat,
-                        kind=kind.Property if kind else "Property",
-                        detail="Feature",
-                        documentation=doc,
-                        insert_text=f"{feat}:",
-                    )
-                )
-
-    elif context == CompletionContext.PHENOMENON_TYPE:
-        prefix = current_word.lower()
-        for phen in sorted(PHENOMENON_TYPES):
-            if phen.startswith(prefix) or not prefix:
-                doc = PHENOMENON_DOCS.get(phen, "")
-                items.append(
-                    _create_completion_item(
-                        label=phen,
-                        kind=kind.EnumMember if kind else "EnumMember",
-                        detail="Optical phenomenon",
-                        documentation=doc,
-                        insert_text=f"{phen}:",
-                    )
-                )
+        items = _SCALE_ITEMS
 
     elif context == CompletionContext.MODIFICATION_PARAM:
         # Context-sensitive parameter completions
         # Detect which modification we're in
-        for mod in ["elongate", "truncate", "taper", "bevel", "flatten"]:
+        for mod, param_items in _MODIFICATION_PARAM_ITEMS.items():
             if re.search(rf"{mod}\s*\(", line, re.IGNORECASE):
-                if mod == "elongate":
-                    for axis in ["a", "b", "c"]:
-                        items.append(
-                            _create_completion_item(
-                                label=f"{axis}:",
-                                kind=kind.Property if kind else "Property",
-                                detail="Axis parameter",
-                                documentation=f"Elongate along {axis}-axis",
-                            )
-                        )
-                elif mod == "truncate":
-                    # Suggest forms for truncation
-                    for form_name in sorted(NAMED_FORMS.keys()):
-                        miller = NAMED_FORMS[form_name]
-                        items.append(
-                            _create_completion_item(
-                                label=f"{form_name}:",
-                                kind=kind.Value if kind else "Value",
-                                detail=f"{{{miller[0]}{miller[1]}{miller[2]}}}",
-                            )
-                        )
-                elif mod == "flatten":
-                    for axis in ["a", "b", "c"]:
-                        items.append(
-                            _create_completion_item(
-                                label=f"{axis}:",
-                                kind=kind.Property if kind else "Property",
-                                detail="Axis parameter",
-                                documentation=f"Flatten along {axis}-axis",
-                            )
-                        )
+                items = param_items
                 break
 
     elif context == CompletionContext.REFERENCE:
         # After $, suggest known definition names from the document
-        prefix = current_word.lower()
         definitions = _find_definitions_in_text(document_text)
         for def_name, def_expr in definitions:
             if def_name.lower().startswith(prefix) or not prefix:
                 items.append(
                     _create_completion_item(
                         label=def_name,
-                        kind=kind.Variable if kind else "Variable",
+                        kind=_kind("Variable"),
                         detail=f"Reference to @{def_name}",
                         documentation=f"Defined as: `{def_expr}`",
                         sort_text="0" + def_name,
@@ -570,81 +707,6 @@ def get_completions(
 
     elif context == CompletionContext.DEFINITION_START:
         # After @ at line start, suggest definition syntax template
-        items.append(
-            _create_completion_item(
-                label="name = expression",
-                kind=kind.Snippet if kind else "Snippet",
-                detail="Named definition",
-                documentation=(
-                    "Define a named CDL expression that can be referenced with `$name`.\n\n"
-                    "Example:\n```\n@prism = {10-10}@1.0\n@body = $prism + {10-11}@0.8\n```"
-                ),
-                insert_text="name = ",
-                sort_text="0",
-            )
-        )
-
-    elif context == CompletionContext.AMORPHOUS_SUBTYPE:
-        # Inside amorphous[, suggest subtypes
-        prefix = current_word.lower()
-        for subtype in sorted(AMORPHOUS_SUBTYPES):
-            if subtype.startswith(prefix) or not prefix:
-                doc = AMORPHOUS_SUBTYPE_DOCS.get(subtype, "")
-                items.append(
-                    _create_completion_item(
-                        label=subtype,
-                        kind=kind.EnumMember if kind else "EnumMember",
-                        detail="Amorphous subtype",
-                        documentation=doc,
-                        insert_text=f"{subtype}]:",
-                    )
-                )
-
-    elif context == CompletionContext.AMORPHOUS_SHAPE:
-        # Inside amorphous[sub]:{, suggest shape descriptors
-        prefix = current_word.lower()
-        for shape in sorted(AMORPHOUS_SHAPES):
-            if shape.startswith(prefix) or not prefix:
-                doc = AMORPHOUS_SHAPE_DOCS.get(shape, "")
-                items.append(
-                    _create_completion_item(
-                        label=shape,
-                        kind=kind.Value if kind else "Value",
-                        detail="Shape descriptor",
-                        documentation=doc,
-                    )
-                )
-
-    elif context == CompletionContext.ARRANGEMENT_TYPE:
-        # After ~, suggest arrangement types
-        prefix = current_word.lower()
-        for arr in sorted(AGGREGATE_ARRANGEMENTS):
-            if arr.startswith(prefix) or not prefix:
-                doc = AGGREGATE_ARRANGEMENT_DOCS.get(arr, "")
-                items.append(
-                    _create_completion_item(
-                        label=arr,
-                        kind=kind.EnumMember if kind else "EnumMember",
-                        detail="Aggregate arrangement",
-                        documentation=doc,
-                        insert_text=f"{arr}[",
-                    )
-                )
-
-    elif context == CompletionContext.AGGREGATE_ORIENTATION:
-        # After ~ arr[N] [, suggest orientations
-        prefix = current_word.lower()
-        for orient in sorted(AGGREGATE_ORIENTATIONS):
-            if orient.startswith(prefix) or not prefix:
-                doc = AGGREGATE_ORIENTATION_DOCS.get(orient, "")
-                items.append(
-                    _create_completion_item(
-                        label=orient,
-                        kind=kind.EnumMember if kind else "EnumMember",
-                        detail="Aggregate orientation",
-                        documentation=doc,
-                        insert_text=f"{orient}]",
-                    )
-                )
+        items = _DEFINITION_START_ITEMS
 
     return items
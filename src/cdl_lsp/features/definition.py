@@ -6,15 +6,22 @@ allowing navigation to the source definitions of forms, twin laws,
 and named CDL definitions (@name = expression / $name references).
 """
 
+import ast
+import bisect
+import functools
 import os
 import re
+import threading
+from collections.abc import Collection
 from typing import Any
+from urllib.parse import quote
 
 try:
     from lsprotocol import types
 except ImportError:
     types = None
 
+from .._patterns import DOCUMENT_DEFINITION_PATTERN, NAME_CHARS
 from ..constants import (
     AGGREGATE_ARRANGEMENTS,
     ALL_POINT_GROUPS,
@@ -24,13 +31,16 @@ from ..constants import (
     DEFINITION_PATTERNS,
     NAMED_FORMS,
     TWIN_LAWS,
+    _norm,
     get_definition_source,
 )
 
-# Pattern for named definitions: @name = expression
-DEFINITION_LINE_PATTERN = re.compile(r"^@(\w+)\s*=\s*(.+)$")
-# Pattern for references: $name
-REFERENCE_PATTERN = re.compile(r"\$(\w+)")
+_URI_PREFIX = "file://"
+
+# Pattern for the word under the cursor (names and point groups like 4/mmm, -3m)
+_WORD_RE = re.compile(r"[A-Za-z0-9_\-/]+")
+# Characters that can start or continue something get_definition resolves
+_VALID_TRIGGER_CHARS = NAME_CHARS | frozenset("$@/-")
 
 
 def _get_word_at_position(line: str, col: int) -> tuple[str, int, int]:
@@ -44,19 +54,55 @@ def _get_word_at_position(line: str, col: int) -> tuple[str, int, int]:
     Returns:
         Tuple of (word, start_col, end_col)
     """
-    word_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-/")
+    for match in _WORD_RE.finditer(line):
+        if match.start() > col:
+            break
+        if col <= match.end():
+            return (match.group(0), match.start(), match.end())
+    return ("", col, col)
 
-    start = col
-    end = col
 
-    while start > 0 and line[start - 1] in word_chars:
-        start -= 1
+@functools.lru_cache(maxsize=16)
+def _build_ast_index(file_path: str, mtime: float) -> dict[str, dict[str, int]]:
+    """
+    Parse a definition source file once and index every definition pattern.
 
-    while end < len(line) and line[end] in word_chars:
-        end += 1
+    The result maps each name in ``DEFINITION_PATTERNS`` to a dict of the
+    string constants in its assigned value (dict keys, set members and
+    nested values), lowercased once here, to the first 0-based line they
+    appear on.
+    ``mtime`` is part of the cache key so edits to the file invalidate it.
 
-    word = line[start:end]
-    return (word, start, end)
+    Args:
+        file_path: Path to the file
+        mtime: Modification time of the file
+
+    Returns:
+        Mapping of pattern to {key: line_number}
+    """
+    with open(file_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=file_path)
+
+    index: dict[str, dict[str, int]] = {pattern: {} for pattern in DEFINITION_PATTERNS.values()}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets, value = [node.target], node.value
+        else:
+            continue
+
+        for target in targets:
+            if not (isinstance(target, ast.Name) and target.id in index):
+                continue
+            entries = index[target.id]
+            for child in ast.walk(value):
+                if isinstance(child, ast.Constant) and isinstance(child.value, str):
+                    key = child.value.lower()
+                    line = child.lineno - 1
+                    entries[key] = min(entries.get(key, line), line)
+
+    return index
 
 
 def _find_line_in_file(file_path: str, pattern: str, target: str) -> int | None:
@@ -66,83 +112,204 @@ def _find_line_in_file(file_path: str, pattern: str, target: str) -> int | None:
     Args:
         file_path: Path to the file
         pattern: Pattern to locate the dict start
-        target: The specific key to find
+        target: The specific key to find (case-insensitive)
 
     Returns:
         Line number (0-based) or None
     """
-    if not os.path.exists(file_path):
-        return None
-
     try:
-        with open(file_path, encoding="utf-8") as f:
-            lines = f.readlines()
-
-        in_dict = False
-        dict_depth = 0
-
-        for i, line in enumerate(lines):
-            # Check if we found the dict start
-            if pattern in line:
-                in_dict = True
-                dict_depth = 0
-
-            if in_dict:
-                # Track brace depth
-                dict_depth += line.count("{") - line.count("}")
-
-                # Look for the target key
-                # Patterns like: 'target': or "target":
-                key_pattern = rf"['\"]({re.escape(target)})['\"]:"
-                if re.search(key_pattern, line, re.IGNORECASE):
-                    return i
-
-                # Also check for unquoted keys
-                if f"'{target}'" in line or f'"{target}"' in line:
-                    return i
-
-                # Exit dict when depth returns to 0
-                if dict_depth <= 0 and i > 0:
-                    in_dict = False
-
+        index = _build_ast_index(file_path, os.path.getmtime(file_path))
+    except Exception:
         return None
 
-    except Exception:
+    entries = index.get(pattern)
+    if entries is None:
         return None
+    return entries.get(target.lower())
 
 
+@functools.cache
 def _get_source_file(category: str) -> str | None:
-    """Get the source file path for a definition category."""
+    """
+    Get the source file path for a definition category.
+
+    Cached per category: the source files ship with the installed packages
+    and do not move at runtime, so the existence check runs only once.
+    """
     source_path = get_definition_source(category)
     if source_path is not None and source_path.exists():
         return str(source_path)
     return None
 
 
-def _create_location(file_path: str, line: int, character: int = 0) -> Any:
-    """Create an LSP Location object."""
-    if types is None:
-        return {
-            "uri": f"file://{file_path}",
-            "range": {
-                "start": {"line": line, "character": character},
-                "end": {"line": line, "character": character + 20},
-            },
-        }
+# Names resolvable per definition category
+_CATEGORY_NAMES: dict[str, Collection[str]] = {
+    "forms": NAMED_FORMS,
+    "twin_laws": TWIN_LAWS,
+    "systems": CRYSTAL_SYSTEMS,
+    "point_groups": ALL_POINT_GROUPS,
+    "amorphous_subtypes": AMORPHOUS_SUBTYPES,
+    "amorphous_shapes": AMORPHOUS_SHAPES,
+    "arrangements": AGGREGATE_ARRANGEMENTS,
+}
+
+# Cheap rejects for words that cannot be a built-in name
+_MAX_KEY_LEN = max(len(name) for names in _CATEGORY_NAMES.values() for name in names)
+_FIRST_CHARS = frozenset(name[0] for names in _CATEGORY_NAMES.values() for name in names)
+
+_INDEX: dict[str, dict[str, tuple[str, int]]] | None = None
+# Indexed name -> category, in _CATEGORY_NAMES precedence order. Point
+# groups are case-sensitive; all other names are matched lowercased.
+_CATEGORY_TABLE: dict[str, str] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def _index_category(category: str) -> dict[str, tuple[str, int]]:
+    """Resolve every known name in a category to its (file_path, line)."""
+    file_path = _get_source_file(category)
+    if not file_path:
+        return {}
+
+    pattern = DEFINITION_PATTERNS[category]
+    entries: dict[str, tuple[str, int]] = {}
+    for name in _CATEGORY_NAMES[category]:
+        found_line = _find_line_in_file(file_path, pattern, name)
+        # Handle both 'spinel' and 'spinel_law' style twin law names
+        if found_line is None and category == "twin_laws" and not name.endswith("_law"):
+            found_line = _find_line_in_file(file_path, pattern, name + "_law")
+        if found_line is not None:
+            entries[name] = (file_path, found_line)
+    return entries
+
+
+def build_definition_index() -> dict[str, dict[str, tuple[str, int]]]:
+    """
+    Build (once) the index of built-in definition locations.
+
+    Called from the server's initialize handler so that go-to-definition
+    never has to touch the disk; also populated lazily on first use.
+
+    Returns:
+        Mapping of category to {name: (file_path, line_number)}
+    """
+    global _INDEX
+    if _INDEX is None:
+        with _INDEX_LOCK:
+            if _INDEX is None:
+                index = {category: _index_category(category) for category in _CATEGORY_NAMES}
+                for category, entries in index.items():
+                    for name in entries:
+                        _CATEGORY_TABLE.setdefault(name, category)
+                _INDEX = index
+    return _INDEX
+
+
+@functools.lru_cache(maxsize=16)
+def _file_uri(file_path: str) -> str:
+    """Build a percent-encoded file:// URI for a path."""
+    return f"{_URI_PREFIX}{quote(file_path, safe='/:@')}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_range(line: int, character: int, end_character: int) -> Any:
+    """
+    Create a single-line LSP Range.
+
+    Ranges are shared between results for the same position; callers
+    must treat them as read-only.
+    """
+    return types.Range(
+        start=types.Position(line=line, character=character),
+        end=types.Position(line=line, character=end_character),
+    )
+
 
-    from urllib.parse import quote
+def _create_location_dict(file_path: str, line: int, character: int = 0) -> Any:
+    """Create a Location as a plain dict (lsprotocol unavailable)."""
+    return {
+        "uri": f"{_URI_PREFIX}{file_path}",
+        "range": {
+            "start": {"line": line, "character": character},
+            "end": {"line": line, "character": character + 20},
+        },
+    }
 
-    uri = f"file://{quote(file_path, safe='/:@')}"
 
+def _create_location_lsp(file_path: str, line: int, character: int = 0) -> Any:
+    """Create an LSP Location object."""
     return types.Location(
-        uri=uri,
-        range=types.Range(
-            start=types.Position(line=line, character=character),
-            end=types.Position(line=line, character=character + 20),
-        ),
+        uri=_file_uri(file_path), range=_make_range(line, character, character + 20)
     )
 
 
+# Resolved once at import; lsprotocol availability cannot change at runtime
+_create_location = _create_location_dict if types is None else _create_location_lsp
+
+
+@functools.cache
+def _builtin_location(category: str, name: str) -> Any:
+    """
+    Create the Location of an indexed built-in name.
+
+    Cached per name, as the index does not change once built; the shared
+    Location must be treated as read-only.
+    """
+    return _create_location(*build_definition_index()[category][name])
+
+
+@functools.lru_cache(maxsize=16)
+def _line_starts(document_text: str) -> tuple[int, ...]:
+    """Return the offset of the start of every line in a document."""
+    starts = [0]
+    pos = document_text.find("\n")
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = document_text.find("\n", pos + 1)
+    return tuple(starts)
+
+
+@functools.lru_cache(maxsize=32)
+def _doc_def_table(document_text: str) -> dict[str, tuple[int, int]]:
+    """
+    Map each @name defined in a document to the position of its name.
+
+    Cached on the document text, so repeated lookups against the same
+    document version reuse the table.
+
+    Args:
+        document_text: Full document text
+
+    Returns:
+        Dict of name to (line_number, character) of the name after @
+    """
+    line_starts = _line_starts(document_text)
+    table: dict[str, tuple[int, int]] = {}
+    for match in DOCUMENT_DEFINITION_PATTERN.finditer(document_text):
+        line_num = bisect.bisect_right(line_starts, match.start()) - 1
+        # First definition wins
+        table.setdefault(match.group(1), (line_num, match.start(1) - line_starts[line_num]))
+    return table
+
+
+def _make_ref_loc_dict(uri: str, line: int, character: int, end_character: int) -> Any:
+    """Create a document Location as a plain dict (lsprotocol unavailable)."""
+    return {
+        "uri": uri,
+        "range": {
+            "start": {"line": line, "character": character},
+            "end": {"line": line, "character": end_character},
+        },
+    }
+
+
+def _make_ref_loc_lsp(uri: str, line: int, character: int, end_character: int) -> Any:
+    """Create a document LSP Location object."""
+    return types.Location(uri=uri, range=_make_range(line, character, end_character))
+
+
+_make_ref_loc = _make_ref_loc_dict if types is None else _make_ref_loc_lsp
+
+
 def _find_definition_in_document(name: str, document_text: str, document_uri: str) -> Any | None:
     """
     Find a @name definition in the document text.
@@ -155,33 +322,12 @@ def _find_definition_in_document(name: str, document_text: str, document_uri: st
     Returns:
         Location object or None
     """
-    lines = document_text.split("\n")
-    for i, doc_line in enumerate(lines):
-        match = DEFINITION_LINE_PATTERN.match(doc_line.strip())
-        if match and match.group(1) == name:
-            # Find the column of the @name
-            stripped = doc_line.lstrip()
-            col_offset = len(doc_line) - len(stripped)
-            # Point to the name after @
-            name_col = col_offset + 1  # skip @
-
-            if types is None:
-                return {
-                    "uri": document_uri,
-                    "range": {
-                        "start": {"line": i, "character": name_col},
-                        "end": {"line": i, "character": name_col + len(name)},
-                    },
-                }
-
-            return types.Location(
-                uri=document_uri,
-                range=types.Range(
-                    start=types.Position(line=i, character=name_col),
-                    end=types.Position(line=i, character=name_col + len(name)),
-                ),
-            )
-    return None
+    position = _doc_def_table(document_text).get(name)
+    if position is None:
+        return None
+
+    line_num, name_col = position
+    return _make_ref_loc(document_uri, line_num, name_col, name_col + len(name))
 
 
 def _is_on_reference(line: str, col: int) -> str | None:
@@ -195,13 +341,34 @@ def _is_on_reference(line: str, col: int) -> str | None:
     Returns:
         Reference name (without $) or None
     """
-    for match in REFERENCE_PATTERN.finditer(line):
-        # Match spans from $ to end of name
-        if match.start() <= col <= match.end():
-            return match.group(1)
+    if col > len(line):
+        return None
+
+    # Cursor inside or just after a name: walk left to its start
+    start = col
+    while start > 0 and line[start - 1] in NAME_CHARS:
+        start -= 1
+    if start > 0 and line[start - 1] == "$":
+        end = _reference_name_end(line, start)
+        if end > start:
+            return line[start:end]
+
+    # Cursor on the $ that opens a reference
+    if col < len(line) and line[col] == "$":
+        end = _reference_name_end(line, col + 1)
+        if end > col + 1:
+            return line[col + 1 : end]
     return None
 
 
+def _reference_name_end(line: str, start: int) -> int:
+    """Return the index just past the reference name starting at ``start``."""
+    end = start
+    while end < len(line) and line[end] in NAME_CHARS:
+        end += 1
+    return end
+
+
 def find_document_definitions(document_text: str) -> list[tuple[str, int, str]]:
     """
     Find all @name = expression definitions in a document.
@@ -212,12 +379,11 @@ def find_document_definitions(document_text: str) -> list[tuple[str, int, str]]:
     Returns:
         List of (name, line_number, expression) tuples
     """
-    definitions = []
-    for i, line in enumerate(document_text.split("\n")):
-        match = DEFINITION_LINE_PATTERN.match(line.strip())
-        if match:
-            definitions.append((match.group(1), i, match.group(2)))
-    return definitions
+    line_starts = _line_starts(document_text)
+    return [
+        (match.group(1), bisect.bisect_right(line_starts, match.start()) - 1, match.group(2))
+        for match in DOCUMENT_DEFINITION_PATTERN.finditer(document_text)
+    ]
 
 
 def get_definition(
@@ -240,6 +406,13 @@ def get_definition(
     Returns:
         Location object or None if no definition found
     """
+    # Nothing to resolve unless the cursor touches a word or reference character
+    if col > len(line) or (
+        (col == len(line) or line[col] not in _VALID_TRIGGER_CHARS)
+        and (col == 0 or line[col - 1] not in _VALID_TRIGGER_CHARS)
+    ):
+        return None
+
     # Check if cursor is on a $reference
     ref_name = _is_on_reference(line, col)
     if ref_name and document_text:
@@ -252,75 +425,20 @@ def get_definition(
     if not word:
         return None
 
-    word_lower = word.lower()
-
-    # Check if it's a named form
-    if word_lower in NAMED_FORMS:
-        file_path = _get_source_file("forms")
-        if file_path:
-            pattern = DEFINITION_PATTERNS["forms"]
-            found_line = _find_line_in_file(file_path, pattern, word_lower)
-            if found_line is not None:
-                return _create_location(file_path, found_line)
-
-    # Check if it's a twin law
-    if word_lower in TWIN_LAWS:
-        file_path = _get_source_file("twin_laws")
-        if file_path:
-            pattern = DEFINITION_PATTERNS["twin_laws"]
-            # Handle both 'spinel' and 'spinel_law' style names
-            found_line = _find_line_in_file(file_path, pattern, word_lower)
-            if found_line is None and not word_lower.endswith("_law"):
-                found_line = _find_line_in_file(file_path, pattern, word_lower + "_law")
-            if found_line is not None:
-                return _create_location(file_path, found_line)
-
-    # Check if it's a crystal system
-    if word_lower in CRYSTAL_SYSTEMS:
-        file_path = _get_source_file("systems")
-        if file_path:
-            pattern = DEFINITION_PATTERNS["systems"]
-            found_line = _find_line_in_file(file_path, pattern, word_lower)
-            if found_line is not None:
-                return _create_location(file_path, found_line)
-
-    # Check if it's a point group
-    if word in ALL_POINT_GROUPS:
-        file_path = _get_source_file("point_groups")
-        if file_path:
-            pattern = DEFINITION_PATTERNS["point_groups"]
-            found_line = _find_line_in_file(file_path, pattern, word)
-            if found_line is not None:
-                return _create_location(file_path, found_line)
-
-    # CDL v2.0: Check if it's an amorphous subtype
-    if word_lower in AMORPHOUS_SUBTYPES:
-        file_path = _get_source_file("amorphous_subtypes")
-        if file_path:
-            pattern = DEFINITION_PATTERNS["amorphous_subtypes"]
-            found_line = _find_line_in_file(file_path, pattern, word_lower)
-            if found_line is not None:
-                return _create_location(file_path, found_line)
-
-    # CDL v2.0: Check if it's an amorphous shape
-    if word_lower in AMORPHOUS_SHAPES:
-        file_path = _get_source_file("amorphous_shapes")
-        if file_path:
-            pattern = DEFINITION_PATTERNS["amorphous_shapes"]
-            found_line = _find_line_in_file(file_path, pattern, word_lower)
-            if found_line is not None:
-                return _create_location(file_path, found_line)
-
-    # CDL v2.0: Check if it's an aggregate arrangement type
-    if word_lower in AGGREGATE_ARRANGEMENTS:
-        file_path = _get_source_file("arrangements")
-        if file_path:
-            pattern = DEFINITION_PATTERNS["arrangements"]
-            found_line = _find_line_in_file(file_path, pattern, word_lower)
-            if found_line is not None:
-                return _create_location(file_path, found_line)
+    if len(word) > _MAX_KEY_LEN:
+        return None
 
-    return None
+    word_lower = _norm(word)
+    if word_lower[0] not in _FIRST_CHARS:
+        return None
+
+    build_definition_index()
+
+    category = _CATEGORY_TABLE.get(word_lower)
+    if category is None or (category == "point_groups" and word != word_lower):
+        return None
+
+    return _builtin_location(category, word_lower)
 
 
 def get_definitions(
@@ -6,7 +6,8 @@ generating LSP diagnostics for errors and warnings.
 """
 
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, replace
 from typing import Any
 
 # Import cdl_parser for parsing
@@ -24,6 +25,7 @@ except ImportError:
     # Fallback for testing without lsprotocol
     types = None
 
+from .._line_cache import parse_line
 from ..constants import (
     AGGREGATE_ARRANGEMENTS,
     ALL_POINT_GROUPS,
@@ -50,7 +52,17 @@ except ImportError:
         return []
 
 
-@dataclass
+# CDL v2.0 constructs come from the shared parse_line scan. Vocabulary
+# checks run against the frozensets from constants; their identifier
+# literals are interned by the compiler, so extracted tokens are interned
+# too and usually match by identity.
+_WORD_RE = re.compile(r"(\w+)")
+
+# Aggregate counts above this draw a performance warning
+_AGG_COUNT_LIMIT = 200
+
+
+@dataclass(slots=True)
 class DiagnosticInfo:
     """Diagnostic information without LSP types dependency."""
 
@@ -130,14 +142,39 @@ def validate_document(text: str) -> list[DiagnosticInfo]:
     Args:
         text: CDL document text
 
+    Returns:
+        List of DiagnosticInfo objects
+    """
+    return validate_changed_lines(text, {})
+
+
+def validate_changed_lines(
+    text: str, line_cache: dict[str, list[DiagnosticInfo]]
+) -> list[DiagnosticInfo]:
+    """
+    Validate a CDL document, re-checking only lines that changed.
+
+    Line diagnostics depend only on the line's text and number, so
+    ``line_cache`` maps stripped line text to the diagnostics last
+    computed for it. Lines found in the cache are reused (moved to their
+    new line number if needed) and only new or edited lines are
+    validated. The cache is updated in place to hold exactly the lines of
+    ``text``, so it stays proportional to the document size.
+
+    Args:
+        text: CDL document text
+        line_cache: Per-document cache, initially empty
+
     Returns:
         List of DiagnosticInfo objects
     """
     diagnostics: list[DiagnosticInfo] = []
+    current: dict[str, list[DiagnosticInfo]] = {}
 
     # Skip empty documents
     text = text.strip()
     if not text:
+        line_cache.clear()
         return diagnostics
 
     # Process each line separately for multi-line CDL support
@@ -150,10 +187,20 @@ def validate_document(text: str) -> list[DiagnosticInfo]:
         if not line_text or line_text.startswith("#"):
             continue
 
-        # Validate the line
-        line_diagnostics = _validate_cdl_line(line_text, line_num)
+        # Validate the line, or reuse the diagnostics of an unchanged line
+        line_diagnostics = current.get(line_text)
+        if line_diagnostics is None:
+            line_diagnostics = line_cache.get(line_text)
+        if line_diagnostics is None:
+            line_diagnostics = _validate_cdl_line(line_text, line_num)
+        elif line_diagnostics and line_diagnostics[0].line != line_num:
+            line_diagnostics = [replace(info, line=line_num) for info in line_diagnostics]
+
+        current[line_text] = line_diagnostics
         diagnostics.extend(line_diagnostics)
 
+    line_cache.clear()
+    line_cache.update(current)
     return diagnostics
 
 
@@ -167,32 +214,13 @@ def _validate_cdl_line(line_text: str, line_num: int) -> list[DiagnosticInfo]:
         # Valid preset name - no errors
         return diagnostics
 
-    # First, check for common issues to provide better quick-fix diagnostics
-    # These run before parser to catch errors with proper code/data for code actions
-    pre_parse_diagnostics: list[DiagnosticInfo] = []
-
-    # Check for syntax errors that we can provide quick fixes for
-    _check_missing_colon(line_text, line_num, pre_parse_diagnostics)
-
-    # Check for typos (system, modification, form, twin)
-    _check_system_typos(line_text, line_num, pre_parse_diagnostics)
-    _check_modification_typos(line_text, line_num, pre_parse_diagnostics)
-    _check_form_typos(line_text, line_num, pre_parse_diagnostics)
-    _check_twin_typos(line_text, line_num, pre_parse_diagnostics)
-
-    # Check for invalid feature names and phenomenon types (warnings, not blocking)
-    _check_feature_names(line_text, line_num, diagnostics)
-    _check_phenomenon_type(line_text, line_num, diagnostics)
+    # Run the checkers into the line's single diagnostics list
+    quick_fix_count = _check_all(line_text, line_num, diagnostics)
 
-    # CDL v2.0: Check amorphous and aggregate elements (warnings/errors)
-    _check_amorphous_subtype(line_text, line_num, diagnostics)
-    _check_amorphous_shapes(line_text, line_num, diagnostics)
-    _check_arrangement_type(line_text, line_num, diagnostics)
-    _check_aggregate_count(line_text, line_num, diagnostics)
-
-    # If we found issues with quick-fix data, return those
-    if pre_parse_diagnostics:
-        return pre_parse_diagnostics
+    # If we found issues with quick-fix data, return only those
+    if quick_fix_count:
+        del diagnostics[quick_fix_count:]
+        return diagnostics
 
     # Try parsing with the actual parser
     if CDL_PARSER_AVAILABLE and _parse_cdl is not None:
@@ -240,15 +268,57 @@ def _validate_cdl_line(line_text: str, line_num: int) -> list[DiagnosticInfo]:
             return diagnostics
 
     # Additional semantic validation (for valid parses)
-    diagnostics.extend(_semantic_validation(line_text, line_num))
+    _semantic_validation(line_text, line_num, diagnostics)
 
     return diagnostics
 
 
-def _semantic_validation(line_text: str, line_num: int) -> list[DiagnosticInfo]:
-    """Perform semantic validation beyond syntax checking."""
-    diagnostics: list[DiagnosticInfo] = []
+def _check_all(line_text: str, line_num: int, diagnostics: list[DiagnosticInfo]) -> int:
+    """
+    Run the pre-parse checkers on a line, appending to one shared list.
+
+    Quick-fix checks run first, so their diagnostics form a prefix of
+    what this call appends.
+
+    Args:
+        line_text: Stripped line to check
+        line_num: Line number for the diagnostics
+        diagnostics: List to append diagnostics to
+
+    Returns:
+        Number of quick-fix diagnostics appended
+    """
+    start = len(diagnostics)
+
+    # First, check for common issues to provide better quick-fix diagnostics
+    # These run before parser to catch errors with proper code/data for code actions
+    _check_missing_colon(line_text, line_num, diagnostics)
+
+    # Check for typos (system, modification, form, twin)
+    _check_system_typos(line_text, line_num, diagnostics)
+    _check_modification_typos(line_text, line_num, diagnostics)
+    _check_form_typos(line_text, line_num, diagnostics)
+    _check_twin_typos(line_text, line_num, diagnostics)
+
+    quick_fix_count = len(diagnostics) - start
+
+    # Check for invalid feature names and phenomenon types (warnings, not blocking)
+    _check_feature_names(line_text, line_num, diagnostics)
+    _check_phenomenon_type(line_text, line_num, diagnostics)
+
+    # CDL v2.0: Check amorphous and aggregate elements (warnings/errors),
+    # only on lines that contain the construct at all
+    if "amorphous" in line_text.lower():
+        _check_amorphous(line_text, line_num, diagnostics)
+    if "~" in line_text:
+        _check_arrangement_type(line_text, line_num, diagnostics)
+        _check_aggregate_count(line_text, line_num, diagnostics)
+
+    return quick_fix_count
+
 
+def _semantic_validation(line_text: str, line_num: int, diagnostics: list[DiagnosticInfo]) -> None:
+    """Perform semantic validation beyond syntax checking."""
     # Check for unusually large scale values
     scale_pattern = r"@(\d+\.?\d*)"
     for match in re.finditer(scale_pattern, line_text):
@@ -300,8 +370,6 @@ def _semantic_validation(line_text: str, line_num: int) -> list[DiagnosticInfo]:
     # Note: Typo checks are now run before parsing in _validate_cdl_line
     # to ensure proper code/data fields are set for code actions
 
-    return diagnostics
-
 
 def _check_form_typos(line_text: str, line_num: int, diagnostics: list[DiagnosticInfo]) -> None:
     """Check for common form name typos."""
@@ -551,64 +619,99 @@ def _check_phenomenon_type(
             )
 
 
-def _check_amorphous_subtype(
-    line_text: str, line_num: int, diagnostics: list[DiagnosticInfo]
+def _check_amorphous(
+    line_text: str,
+    line_num: int,
+    diagnostics: list[DiagnosticInfo],
+    subtype: bool = True,
+    shapes: bool = True,
 ) -> None:
-    """Check for invalid amorphous subtypes."""
-    match = re.search(r"amorphous\s*\[(\w+)\]", line_text, re.IGNORECASE)
-    if match:
-        subtype = match.group(1).lower()
-        if subtype != "none" and subtype not in AMORPHOUS_SUBTYPES:
-            start = match.start(1)
+    """
+    Check amorphous subtypes and shape descriptors from one line scan.
+
+    The subtype of the first amorphous[sub] is checked, as are the shapes
+    of the first amorphous[sub]:{shapes}.
+
+    Args:
+        line_text: Line to check
+        line_num: Line number for the diagnostics
+        diagnostics: List to append diagnostics to
+        subtype: Whether to check the subtype
+        shapes: Whether to check the shape descriptors
+    """
+    parsed = parse_line(line_text)
+    if subtype and parsed.subtype is not None:
+        _check_subtype(parsed.subtype, parsed.subtype_start, line_num, diagnostics)
+    if shapes and parsed.shapes is not None:
+        _check_shapes(parsed.shapes, parsed.shapes_start, line_num, diagnostics)
+
+
+def _check_subtype(
+    subtype_text: str, start: int, line_num: int, diagnostics: list[DiagnosticInfo]
+) -> None:
+    """Check an amorphous subtype starting at ``start``."""
+    subtype = sys.intern(subtype_text.lower())
+    if subtype != "none" and subtype not in AMORPHOUS_SUBTYPES:
+        diagnostics.append(
+            DiagnosticInfo(
+                line=line_num,
+                start_char=start,
+                end_char=start + len(subtype),
+                message=f"Unknown amorphous subtype '{subtype}'. "
+                f"Known subtypes: {', '.join(sorted(AMORPHOUS_SUBTYPES))}",
+                severity="warning",
+                code="unknown-amorphous-subtype",
+                data={"original": subtype},
+            )
+        )
+
+
+def _check_shapes(
+    shapes_text: str, shapes_start: int, line_num: int, diagnostics: list[DiagnosticInfo]
+) -> None:
+    """Check amorphous shape descriptors starting at ``shapes_start``."""
+    for shape_match in _WORD_RE.finditer(shapes_text):
+        shape = sys.intern(shape_match.group(1).lower())
+        if shape not in AMORPHOUS_SHAPES:
+            abs_start = shapes_start + shape_match.start(1)
             diagnostics.append(
                 DiagnosticInfo(
                     line=line_num,
-                    start_char=start,
-                    end_char=start + len(subtype),
-                    message=f"Unknown amorphous subtype '{subtype}'. "
-                    f"Known subtypes: {', '.join(sorted(AMORPHOUS_SUBTYPES))}",
+                    start_char=abs_start,
+                    end_char=abs_start + len(shape),
+                    message=f"Unknown amorphous shape '{shape}'. "
+                    f"Known shapes: {', '.join(sorted(AMORPHOUS_SHAPES))}",
                     severity="warning",
-                    code="unknown-amorphous-subtype",
-                    data={"original": subtype},
+                    code="unknown-amorphous-shape",
+                    data={"original": shape},
                 )
             )
 
 
+def _check_amorphous_subtype(
+    line_text: str, line_num: int, diagnostics: list[DiagnosticInfo]
+) -> None:
+    """Check for invalid amorphous subtypes."""
+    _check_amorphous(line_text, line_num, diagnostics, shapes=False)
+
+
 def _check_amorphous_shapes(
     line_text: str, line_num: int, diagnostics: list[DiagnosticInfo]
 ) -> None:
     """Check for invalid amorphous shape descriptors."""
-    # Match amorphous[sub]:{shapes}
-    match = re.search(r"amorphous\s*\[\w+\]\s*:\s*\{([^}]+)\}", line_text, re.IGNORECASE)
-    if match:
-        shapes_text = match.group(1)
-        shapes_start = match.start(1)
-        for shape_match in re.finditer(r"(\w+)", shapes_text):
-            shape = shape_match.group(1).lower()
-            if shape not in AMORPHOUS_SHAPES:
-                abs_start = shapes_start + shape_match.start(1)
-                diagnostics.append(
-                    DiagnosticInfo(
-                        line=line_num,
-                        start_char=abs_start,
-                        end_char=abs_start + len(shape),
-                        message=f"Unknown amorphous shape '{shape}'. "
-                        f"Known shapes: {', '.join(sorted(AMORPHOUS_SHAPES))}",
-                        severity="warning",
-                        code="unknown-amorphous-shape",
-                        data={"original": shape},
-                    )
-                )
+    _check_amorphous(line_text, line_num, diagnostics, subtype=False)
 
 
 def _check_arrangement_type(
     line_text: str, line_num: int, diagnostics: list[DiagnosticInfo]
 ) -> None:
     """Check for invalid aggregate arrangement types."""
-    for match in re.finditer(r"~\s*(\w+)\s*\[", line_text):
-        arrangement = match.group(1).lower()
+    for operator in parse_line(line_text).operators:
+        if operator.arrangement is None:
+            continue
+        arrangement = sys.intern(operator.arrangement.lower())
         if arrangement not in AGGREGATE_ARRANGEMENTS:
-            start = match.start(1)
+            start = operator.arrangement_start
             diagnostics.append(
                 DiagnosticInfo(
                     line=line_num,
@@ -627,16 +730,19 @@ def _check_aggregate_count(
     line_text: str, line_num: int, diagnostics: list[DiagnosticInfo]
 ) -> None:
     """Warn on aggregate count > 200."""
-    for match in re.finditer(r"~\s*\w+\s*\[(\d+)\]", line_text):
-        count = int(match.group(1))
-        if count > 200:
-            start = match.start(1)
+    for operator in parse_line(line_text).operators:
+        if operator.count is None:
+            continue
+        count = int(operator.count)
+        if count > _AGG_COUNT_LIMIT:
+            start = operator.count_start
             diagnostics.append(
                 DiagnosticInfo(
                     line=line_num,
                     start_char=start,
-                    end_char=start + len(match.group(1)),
-                    message=f"Aggregate count {count} is very large (> 200). "
+                    end_char=start + len(operator.count),
+                    message=f"Aggregate count {count} is very large "
+                    f"(> {_AGG_COUNT_LIMIT}). "
                     "This may cause performance issues in rendering.",
                     severity="warning",
                     code="aggregate-count-large",
@@ -645,15 +751,22 @@ def _check_aggregate_count(
             )
 
 
-def get_diagnostics(text: str) -> list[Any]:
+def get_diagnostics(
+    text: str, line_cache: dict[str, list[DiagnosticInfo]] | None = None
+) -> list[Any]:
     """
     Get LSP Diagnostic objects for a CDL document.
 
     Args:
         text: CDL document text
+        line_cache: Optional per-document cache for incremental validation
+            (see validate_changed_lines)
 
     Returns:
         List of lsprotocol.types.Diagnostic objects
     """
-    diagnostic_infos = validate_document(text)
+    if line_cache is None:
+        diagnostic_infos = validate_document(text)
+    else:
+        diagnostic_infos = validate_changed_lines(text, line_cache)
     return [_create_diagnostic(info) for info in diagnostic_infos]
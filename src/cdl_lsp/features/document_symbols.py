@@ -7,6 +7,7 @@ definitions (@name = expression) in the sidebar.
 """
 
 import re
+from collections.abc import Iterator
 from typing import Any
 
 try:
@@ -14,8 +15,18 @@ try:
 except ImportError:
     types = None
 
-# Pattern for named definitions: @name = expression
-DEFINITION_LINE_PATTERN = re.compile(r"^@(\w+)\s*=\s*(.+)$")
+from .._line_cache import parse_line
+from .._patterns import DEFINITION_LINE_PATTERN
+from ..constants import CRYSTAL_SYSTEMS
+
+# Line patterns, compiled once
+_AMORPHOUS_HEAD_RE = re.compile(r"(amorphous)\s*\[([^\]]*)\]", re.IGNORECASE)
+_SYSTEM_HEAD_RE = re.compile(r"(\w+)\s*\[([^\]]+)\]")
+_MILLER_RE = re.compile(r"\{([^}]+)\}")
+_NAMED_FORM_RE = re.compile(r":(\w+)(?=[@+|]|$)")
+_MODIFICATION_RE = re.compile(
+    r"\b(elongate|truncate|taper|bevel|twin)\s*\(([^)]*)\)", re.IGNORECASE
+)
 
 
 def get_document_symbols(text: str) -> list[Any]:
@@ -129,7 +140,7 @@ def _parse_amorphous_line(original_line: str, line: str, line_num: int) -> Any |
         return None
 
     # Match amorphous[subtype]
-    amor_match = re.match(r"(amorphous)\s*\[([^\]]*)\]", line, re.IGNORECASE)
+    amor_match = _AMORPHOUS_HEAD_RE.match(line)
     if not amor_match:
         return None
 
@@ -175,7 +186,7 @@ def _parse_cdl_line(original_line: str, line: str, line_num: int) -> Any | None:
         return None
 
     # Match system and point group
-    system_match = re.match(r"(\w+)\s*\[([^\]]+)\]", line)
+    system_match = _SYSTEM_HEAD_RE.match(line)
     if not system_match:
         return None
 
@@ -221,133 +232,114 @@ def _extract_children(line: str, line_num: int, base_col: int) -> list[Any]:
     Returns:
         List of child DocumentSymbol objects
     """
-    if types is None:
-        return []
+    return list(_iter_children(line, line_num, base_col))
 
-    children: list[Any] = []
+
+def _iter_children(line: str, line_num: int, base_col: int) -> Iterator[Any]:
+    """
+    Yield form and modification symbols from a CDL line.
+
+    Args:
+        line: CDL line content
+        line_num: Line number
+        base_col: Base column offset
+
+    Yields:
+        Child DocumentSymbol objects
+    """
+    if types is None:
+        return
 
     # Find Miller indices {hkl}
-    for match in re.finditer(r"\{([^}]+)\}", line):
+    for match in _MILLER_RE.finditer(line):
         miller = match.group(1)
         start = match.start()
         end = match.end()
 
-        children.append(
-            types.DocumentSymbol(
-                name=f"{{{miller}}}",
-                kind=types.SymbolKind.Field,
-                range=types.Range(
-                    start=types.Position(line=line_num, character=base_col + start),
-                    end=types.Position(line=line_num, character=base_col + end),
-                ),
-                selection_range=types.Range(
-                    start=types.Position(line=line_num, character=base_col + start),
-                    end=types.Position(line=line_num, character=base_col + end),
-                ),
-                detail="Miller index",
-            )
+        yield types.DocumentSymbol(
+            name=f"{{{miller}}}",
+            kind=types.SymbolKind.Field,
+            range=types.Range(
+                start=types.Position(line=line_num, character=base_col + start),
+                end=types.Position(line=line_num, character=base_col + end),
+            ),
+            selection_range=types.Range(
+                start=types.Position(line=line_num, character=base_col + start),
+                end=types.Position(line=line_num, character=base_col + end),
+            ),
+            detail="Miller index",
         )
 
     # Find named forms (after : and before @, +, |)
-    form_pattern = r":(\w+)(?=[@+|]|$)"
-    for match in re.finditer(form_pattern, line):
+    for match in _NAMED_FORM_RE.finditer(line):
         form_name = match.group(1)
         # Skip if it's a crystal system
-        if form_name.lower() in (
-            "cubic",
-            "tetragonal",
-            "orthorhombic",
-            "hexagonal",
-            "trigonal",
-            "monoclinic",
-            "triclinic",
-        ):
+        if form_name.lower() in CRYSTAL_SYSTEMS:
             continue
         start = match.start(1)
         end = match.end(1)
 
-        children.append(
-            types.DocumentSymbol(
-                name=form_name,
-                kind=types.SymbolKind.Field,
-                range=types.Range(
-                    start=types.Position(line=line_num, character=base_col + start),
-                    end=types.Position(line=line_num, character=base_col + end),
-                ),
-                selection_range=types.Range(
-                    start=types.Position(line=line_num, character=base_col + start),
-                    end=types.Position(line=line_num, character=base_col + end),
-                ),
-                detail="Named form",
-            )
+        yield types.DocumentSymbol(
+            name=form_name,
+            kind=types.SymbolKind.Field,
+            range=types.Range(
+                start=types.Position(line=line_num, character=base_col + start),
+                end=types.Position(line=line_num, character=base_col + end),
+            ),
+            selection_range=types.Range(
+                start=types.Position(line=line_num, character=base_col + start),
+                end=types.Position(line=line_num, character=base_col + end),
+            ),
+            detail="Named form",
         )
 
     # Find modifications (elongate, truncate, taper, bevel, twin)
-    mod_pattern = r"\b(elongate|truncate|taper|bevel|twin)\s*\(([^)]*)\)"
-    for match in re.finditer(mod_pattern, line, re.IGNORECASE):
+    for match in _MODIFICATION_RE.finditer(line):
         mod_name = match.group(1)
         mod_params = match.group(2)
         start = match.start()
         end = match.end()
 
-        children.append(
-            types.DocumentSymbol(
-                name=f"{mod_name}({mod_params})" if mod_params else mod_name,
-                kind=types.SymbolKind.Method
-                if mod_name.lower() == "twin"
-                else types.SymbolKind.Property,
-                range=types.Range(
-                    start=types.Position(line=line_num, character=base_col + start),
-                    end=types.Position(line=line_num, character=base_col + end),
-                ),
-                selection_range=types.Range(
-                    start=types.Position(line=line_num, character=base_col + match.start(1)),
-                    end=types.Position(line=line_num, character=base_col + match.end(1)),
-                ),
-                detail="Twin law" if mod_name.lower() == "twin" else "Modification",
-            )
-        )
-
-    # CDL v2.0: Find nested growth operators (>)
-    for match in re.finditer(r"\s*>\s*", line):
-        start = match.start()
-        end = match.end()
-        children.append(
-            types.DocumentSymbol(
-                name=">",
-                kind=types.SymbolKind.Operator,
-                range=types.Range(
-                    start=types.Position(line=line_num, character=base_col + start),
-                    end=types.Position(line=line_num, character=base_col + end),
-                ),
-                selection_range=types.Range(
-                    start=types.Position(line=line_num, character=base_col + start),
-                    end=types.Position(line=line_num, character=base_col + end),
-                ),
-                detail="Nested growth",
-            )
+        yield types.DocumentSymbol(
+            name=f"{mod_name}({mod_params})" if mod_params else mod_name,
+            kind=types.SymbolKind.Method
+            if mod_name.lower() == "twin"
+            else types.SymbolKind.Property,
+            range=types.Range(
+                start=types.Position(line=line_num, character=base_col + start),
+                end=types.Position(line=line_num, character=base_col + end),
+            ),
+            selection_range=types.Range(
+                start=types.Position(line=line_num, character=base_col + match.start(1)),
+                end=types.Position(line=line_num, character=base_col + match.end(1)),
+            ),
+            detail="Twin law" if mod_name.lower() == "twin" else "Modification",
         )
 
-    # CDL v2.0: Find aggregate operators (~ arrangement[N])
-    for match in re.finditer(r"~\s*(\w+)\s*\[(\d+)\]", line):
-        arrangement = match.group(1)
-        count = match.group(2)
-        start = match.start()
-        end = match.end()
-        children.append(
-            types.DocumentSymbol(
-                name=f"~ {arrangement}[{count}]",
-                kind=types.SymbolKind.Operator,
-                range=types.Range(
-                    start=types.Position(line=line_num, character=base_col + start),
-                    end=types.Position(line=line_num, character=base_col + end),
-                ),
-                selection_range=types.Range(
-                    start=types.Position(line=line_num, character=base_col + start),
-                    end=types.Position(line=line_num, character=base_col + end),
-                ),
-                detail=f"Aggregate ({arrangement}, {count} individuals)",
-            )
+    # CDL v2.0: Find nested growth (>) and aggregate (~ arrangement[N]) operators
+    for operator in parse_line(line).operators:
+        if operator.arrangement is None:
+            name = ">"
+            detail = "Nested growth"
+        elif operator.count is not None:
+            arrangement = operator.arrangement
+            count = operator.count
+            name = f"~ {arrangement}[{count}]"
+            detail = f"Aggregate ({arrangement}, {count} individuals)"
+        else:
+            continue
+        start = operator.start
+        end = operator.end
+        yield types.DocumentSymbol(
+            name=name,
+            kind=types.SymbolKind.Operator,
+            range=types.Range(
+                start=types.Position(line=line_num, character=base_col + start),
+                end=types.Position(line=line_num, character=base_col + end),
+            ),
+            selection_range=types.Range(
+                start=types.Position(line=line_num, character=base_col + start),
+                end=types.Position(line=line_num, character=base_col + end),
+            ),
+            detail=detail,
         )
-
-    return children
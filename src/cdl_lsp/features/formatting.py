@@ -20,6 +20,67 @@ try:
 except ImportError:
     types = None
 
+# Patterns used by format_line, compiled once at import
+_LEADING_WS_RE = re.compile(r"^(\s*)")
+_DEFINITION_RE = re.compile(r"^(@\w+)\s*=\s*(.+)$")
+_SYSTEM_RE = re.compile(
+    r"^(Cubic|Tetragonal|Orthorhombic|Hexagonal|Trigonal|Monoclinic|Triclinic|Amorphous)\b",
+    re.IGNORECASE,
+)
+# Operators written with a single space on each side
+_SPACED_OPERATORS = frozenset("+|>~")
+_SPACE_AT_RE = re.compile(r"\s+@")
+_BRACES_RE = re.compile(r"\{\s*([^}]+?)\s*\}")
+_BRACKETS_RE = re.compile(r"\[\s*([^\]]+?)\s*\]")
+_OPEN_BRACKET_RE = re.compile(r"\[\s+")
+_CLOSE_BRACKET_RE = re.compile(r"\s+\]")
+_COLON_RE = re.compile(r":\s+")
+_AMORPHOUS_RE = re.compile(r"(amorphous)\s*\[\s*(\w+)\s*\]\s*:\s*\{", re.IGNORECASE)
+# (space before "(", spaces inside "(...)") for each modification
+_MODIFICATION_RES = tuple(
+    (
+        re.compile(rf"({mod})\s+\(", re.IGNORECASE),
+        re.compile(rf"({mod})\(\s*([^)]*?)\s*\)", re.IGNORECASE),
+    )
+    for mod in ["elongate", "truncate", "taper", "bevel", "twin"]
+)
+_CAPITALIZED_MODIFICATION_RES = tuple(
+    (re.compile(rf"\b{mod}\b"), mod.lower())
+    for mod in ["Elongate", "Truncate", "Taper", "Bevel", "Twin"]
+)
+_PARAM_DIGIT_RE = re.compile(r"(\w)\s*:\s*(\d)")
+_PARAM_LETTER_RE = re.compile(r"(\w)\s*:\s*([a-z])", re.IGNORECASE)
+_DOUBLE_SPACE_RE = re.compile(r"  +")
+# Characters at least one of which every punctuation rule needs to apply
+_FORMAT_TRIGGER_CHARS = frozenset("@[]{}:(") | _SPACED_OPERATORS
+
+
+def _normalize_spaces(text: str) -> str:
+    """
+    Put exactly one space on each side of the +, |, > and ~ operators.
+
+    Whitespace runs next to an operator collapse into that single space;
+    other whitespace is left alone. Equivalent to substituting
+    ``\\s*OP\\s*`` with `` OP `` for each operator in turn, in one scan.
+    """
+    if not any(op in text for op in _SPACED_OPERATORS):
+        return text
+
+    out: list[str] = []
+    after_operator = False
+    for ch in text:
+        if ch in _SPACED_OPERATORS:
+            while out and out[-1].isspace():
+                out.pop()
+            out += (" ", ch, " ")
+            after_operator = True
+        elif after_operator and ch.isspace():
+            continue
+        else:
+            after_operator = False
+            out.append(ch)
+    return "".join(out)
+
 
 def format_cdl(text: str, options: Any | None = None) -> list[Any]:
     """
@@ -67,21 +128,33 @@ def format_line(line: str) -> str:
     # Preserve leading whitespace
     leading_ws = ""
     content = line
-    ws_match = re.match(r"^(\s*)", line)
+    ws_match = _LEADING_WS_RE.match(line)
     if ws_match:
         leading_ws = ws_match.group(1)
         content = line[len(leading_ws) :]
 
+    stripped = content.strip()
+
     # Skip empty lines
-    if not content.strip():
+    if not stripped:
         return line
 
     # Skip comments (preserve as-is)
-    if content.strip().startswith("#"):
+    if stripped.startswith("#"):
+        return line
+
+    # Skip lines that no rule below would change: no operator or bracket
+    # characters, no double spaces, no trailing whitespace, nothing to lowercase
+    if (
+        _FORMAT_TRIGGER_CHARS.isdisjoint(content)
+        and "  " not in content
+        and not content[-1].isspace()
+        and content.lower() == content
+    ):
         return line
 
     # Handle definition lines: @name = expression
-    def_match = re.match(r"^(@\w+)\s*=\s*(.+)$", content.strip())
+    def_match = _DEFINITION_RE.match(stripped)
     if def_match:
         def_name = def_match.group(1)
         def_expr = def_match.group(2)
@@ -92,91 +165,61 @@ def format_line(line: str) -> str:
     formatted = content
 
     # 1. Lowercase crystal system names (including amorphous)
-    formatted = re.sub(
-        r"^(Cubic|Tetragonal|Orthorhombic|Hexagonal|Trigonal|Monoclinic|Triclinic|Amorphous)\b",
-        lambda m: m.group(1).lower(),
-        formatted,
-        flags=re.IGNORECASE,
-    )
-
-    # 2. Normalize spacing around + (form addition)
-    # Before: {111}+{100}, {111}  +  {100}
-    # After: {111} + {100}
-    formatted = re.sub(r"\s*\+\s*", " + ", formatted)
-
-    # 3. Normalize spacing around | (modification separator)
-    # Before: {111}|twin(...), {111}  |  twin(...)
-    # After: {111} | twin(...)
-    formatted = re.sub(r"\s*\|\s*", " | ", formatted)
+    formatted = _SYSTEM_RE.sub(lambda m: m.group(1).lower(), formatted)
 
-    # 3a. CDL v2.0: Normalize spacing around > (nested growth)
-    # Before: {111}>{100}, {111}  >  {100}
-    # After: {111} > {100}
-    formatted = re.sub(r"\s*>\s*", " > ", formatted)
-
-    # 3b. CDL v2.0: Normalize spacing around ~ (aggregate)
-    # Before: {111}~parallel[20], {111}  ~  parallel[20]
-    # After: {111} ~ parallel[20]
-    formatted = re.sub(r"\s*~\s*", " ~ ", formatted)
+    # 2. Normalize spacing around +, |, > and ~ in a single pass
+    # Before: {111}+{100}, {111}  |  twin(...), {111}>{100}, {111}~parallel[20]
+    # After: {111} + {100}, {111} | twin(...), {111} > {100}, {111} ~ parallel[20]
+    formatted = _normalize_spaces(formatted)
 
     # 4. No space before @
     # Before: {111} @1.0
     # After: {111}@1.0
-    formatted = re.sub(r"\s+@", "@", formatted)
+    formatted = _SPACE_AT_RE.sub("@", formatted)
 
     # 5. No space inside {} for Miller indices
     # Before: { 111 }, {1 1 1}
     # After: {111}
-    formatted = re.sub(
-        r"\{\s*([^}]+?)\s*\}", lambda m: "{" + m.group(1).replace(" ", "") + "}", formatted
-    )
+    formatted = _BRACES_RE.sub(lambda m: "{" + m.group(1).replace(" ", "") + "}", formatted)
 
     # 6. No space inside [] for point group
     # Before: [ m3m ]
     # After: [m3m]
-    formatted = re.sub(r"\[\s*([^\]]+?)\s*\]", lambda m: "[" + m.group(1).strip() + "]", formatted)
+    formatted = _BRACKETS_RE.sub(lambda m: "[" + m.group(1).strip() + "]", formatted)
 
     # 7. No space after [ or before ]
-    formatted = re.sub(r"\[\s+", "[", formatted)
-    formatted = re.sub(r"\s+\]", "]", formatted)
+    formatted = _OPEN_BRACKET_RE.sub("[", formatted)
+    formatted = _CLOSE_BRACKET_RE.sub("]", formatted)
 
     # 8. Single space after : when followed by form/miller
     # Before: cubic[m3m]:  {111}
     # After: cubic[m3m]:{111}
-    formatted = re.sub(r":\s+", ":", formatted)
+    formatted = _COLON_RE.sub(":", formatted)
 
     # 8a. CDL v2.0: Normalize amorphous spacing: amorphous[sub]:{shapes}
-    formatted = re.sub(
-        r"(amorphous)\s*\[\s*(\w+)\s*\]\s*:\s*\{",
-        r"\1[\2]:{",
-        formatted,
-        flags=re.IGNORECASE,
-    )
+    formatted = _AMORPHOUS_RE.sub(r"\1[\2]:{", formatted)
 
     # 9. Normalize modification calls - no space before (
     # Before: twin ( spinel )
     # After: twin(spinel)
-    for mod in ["elongate", "truncate", "taper", "bevel", "twin"]:
+    for space_re, args_re in _MODIFICATION_RES:
         # Fix space before parenthesis
-        formatted = re.sub(rf"({mod})\s+\(", r"\1(", formatted, flags=re.IGNORECASE)
+        formatted = space_re.sub(r"\1(", formatted)
         # Fix spaces inside parentheses
-        pattern = rf"({mod})\(\s*([^)]*?)\s*\)"
-        formatted = re.sub(
-            pattern, lambda m: f"{m.group(1)}({m.group(2).strip()})", formatted, flags=re.IGNORECASE
-        )
+        formatted = args_re.sub(lambda m: f"{m.group(1)}({m.group(2).strip()})", formatted)
 
     # 10. Lowercase modification names
-    for mod in ["Elongate", "Truncate", "Taper", "Bevel", "Twin"]:
-        formatted = re.sub(rf"\b{mod}\b", mod.lower(), formatted)
+    for name_re, lower_name in _CAPITALIZED_MODIFICATION_RES:
+        formatted = name_re.sub(lower_name, formatted)
 
     # 11. Normalize colon-separated parameters in modifications
     # Before: elongate(c : 1.5)
     # After: elongate(c:1.5)
-    formatted = re.sub(r"(\w)\s*:\s*(\d)", r"\1:\2", formatted)
-    formatted = re.sub(r"(\w)\s*:\s*([a-z])", r"\1:\2", formatted, flags=re.IGNORECASE)
+    formatted = _PARAM_DIGIT_RE.sub(r"\1:\2", formatted)
+    formatted = _PARAM_LETTER_RE.sub(r"\1:\2", formatted)
 
     # 12. Fix double spaces
-    formatted = re.sub(r"  +", " ", formatted)
+    formatted = _DOUBLE_SPACE_RE.sub(" ", formatted)
 
     # 13. Trim trailing whitespace
     formatted = formatted.rstrip()
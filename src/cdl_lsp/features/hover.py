@@ -14,19 +14,15 @@ except ImportError:
     types = None
 
 from ..constants import (
-    ALL_POINT_GROUPS,
-    CRYSTAL_SYSTEMS,
     FORM_DOCS,
-    MODIFICATION_DOCS,
-    MODIFICATIONS,
     NAMED_FORMS,
-    POINT_GROUP_DOCS,
-    SYSTEM_DOCS,
-    TWIN_LAW_DOCS,
-    TWIN_LAWS,
+    REGISTRY,
     get_system_for_point_group,
 )
 
+# Words can contain alphanumerics, underscores, hyphens, and slashes (for point groups)
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-/")
+
 
 def _get_word_at_position(line: str, col: int) -> tuple[str, int, int]:
     """
@@ -45,19 +41,15 @@ def _get_word_at_position(line: str, col: int) -> tuple[str, int, int]:
     if col < 0:
         col = 0
 
-    # Find word boundaries
-    # Words can contain alphanumerics, underscores, hyphens, and slashes (for point groups)
-    word_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-/")
-
     start = col
     end = col
 
     # Expand left
-    while start > 0 and line[start - 1] in word_chars:
+    while start > 0 and line[start - 1] in _WORD_CHARS:
         start -= 1
 
     # Expand right
-    while end < len(line) and line[end] in word_chars:
+    while end < len(line) and line[end] in _WORD_CHARS:
         end += 1
 
     word = line[start:end]
@@ -128,49 +120,21 @@ def get_hover_info(line: str, col: int, line_num: int = 0) -> Any | None:
     if not word:
         return None
 
+    # Systems, point groups, forms, twin laws and modifications share one
+    # registry; point groups are case-sensitive and all lowercase.
     word_lower = word.lower()
-
-    # Check if it's a crystal system
-    if word_lower in CRYSTAL_SYSTEMS:
-        content = SYSTEM_DOCS.get(word_lower)
-        if content:
-            return _create_hover(content, start, end, line_num)
-
-    # Check if it's a point group
-    if word in ALL_POINT_GROUPS:
-        content = POINT_GROUP_DOCS.get(word)
-        if content:
+    entry = REGISTRY.get(word_lower)
+    if entry is not None and (entry.category != "point_groups" or word == word_lower):
+        content = entry.doc
+        if entry.category == "point_groups":
             # Add system info
             system = get_system_for_point_group(word)
             if system:
                 content += f"\n\nBelongs to **{system}** system."
-            return _create_hover(content, start, end, line_num)
-
-    # Check if it's a named form
-    if word_lower in NAMED_FORMS:
-        content = FORM_DOCS.get(word_lower)
-        if content:
+        elif entry.category == "forms":
             miller = NAMED_FORMS[word_lower]
             content += f"\n\nMiller indices: {{{miller[0]}{miller[1]}{miller[2]}}}"
-            return _create_hover(content, start, end, line_num)
-
-    # Check if it's a twin law
-    if word_lower in TWIN_LAWS:
-        content = TWIN_LAW_DOCS.get(word_lower)
-        if content:
-            return _create_hover(content, start, end, line_num)
-
-    # Check if it's a modification
-    if word_lower in MODIFICATIONS:
-        content = MODIFICATION_DOCS.get(word_lower)
-        if content:
-            return _create_hover(content, start, end, line_num)
-
-    # Check for 'twin' keyword
-    if word_lower == "twin":
-        content = MODIFICATION_DOCS.get("twin")
-        if content:
-            return _create_hover(content, start, end, line_num)
+        return _create_hover(content, start, end, line_num)
 
     # Check for scale value (@N.N)
     scale_match = re.search(r"@(\d+\.?\d*)", line)
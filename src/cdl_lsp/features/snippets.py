@@ -19,6 +19,8 @@ try:
 except ImportError:
     types = None
 
+from .._items import CompletionItemInfo
+
 
 def _get_presets() -> dict:
     """Load presets from crystal_presets module."""
@@ -61,14 +63,14 @@ def _create_snippet_item(name: str, preset: dict, sort_prefix: str = "") -> Any:
     detail = f"→ {cdl[:40]}{'...' if len(cdl) > 40 else ''}"
 
     if types is None:
-        return {
-            "label": name,
-            "kind": "Snippet",
-            "detail": detail,
-            "documentation": documentation,
-            "insert_text": cdl,
-            "insert_text_format": 2,  # Snippet format
-        }
+        return CompletionItemInfo(
+            label=name,
+            kind="Snippet",
+            detail=detail,
+            documentation=documentation,
+            insert_text=cdl,
+            insert_text_format=2,  # Snippet format
+        )
 
     return types.CompletionItem(
         label=name,
@@ -30,7 +30,7 @@ except ImportError:
 
 from .features.code_actions import get_code_actions
 from .features.completion import get_completions
-from .features.definition import get_definition
+from .features.definition import build_definition_index, get_definition
 from .features.diagnostics import get_diagnostics
 from .features.document_symbols import get_document_symbols
 from .features.explain import get_explain_result
@@ -55,6 +55,8 @@ def create_server() -> "LanguageServer":
 
     # Document storage
     documents: dict = {}
+    # Per-document line diagnostics, for incremental revalidation
+    line_caches: dict = {}
 
     # ==========================================================================
     # Lifecycle Events
@@ -66,11 +68,15 @@ def create_server() -> "LanguageServer":
         logger.info(f"Initializing CDL Language Server {SERVER_VERSION}")
         logger.info(f"Root URI: {params.root_uri}")
 
+        # Index built-in definition sources up front so go-to-definition
+        # requests are served from memory
+        build_definition_index()
+
         return types.InitializeResult(
             capabilities=types.ServerCapabilities(
                 text_document_sync=types.TextDocumentSyncOptions(
                     open_close=True,
-                    change=types.TextDocumentSyncKind.Full,
+                    change=types.TextDocumentSyncKind.Incremental,
                     save=types.SaveOptions(include_text=True),
                 ),
                 completion_provider=types.CompletionOptions(
@@ -118,7 +124,7 @@ def create_server() -> "LanguageServer":
         documents[uri] = text
 
         # Publish diagnostics
-        diagnostics = get_diagnostics(text)
+        diagnostics = get_diagnostics(text, line_caches.setdefault(uri, {}))
         server.text_document_publish_diagnostics(
             types.PublishDiagnosticsParams(uri=uri, diagnostics=diagnostics)
         )
@@ -128,17 +134,14 @@ def create_server() -> "LanguageServer":
         """Handle document change notification."""
         uri = params.text_document.uri
 
-        # Full sync - get the complete new content
-        for change in params.content_changes:
-            if hasattr(change, "text"):
-                documents[uri] = change.text
-                break
+        # Incremental sync - pygls applies the change ranges to its workspace copy
+        documents[uri] = server.workspace.get_text_document(uri).source
 
         text = documents.get(uri, "")
         logger.debug(f"Document changed: {uri}, length: {len(text)}")
 
-        # Publish diagnostics
-        diagnostics = get_diagnostics(text)
+        # Publish diagnostics, revalidating only lines that changed
+        diagnostics = get_diagnostics(text, line_caches.setdefault(uri, {}))
         server.text_document_publish_diagnostics(
             types.PublishDiagnosticsParams(uri=uri, diagnostics=diagnostics)
         )
@@ -151,6 +154,7 @@ def create_server() -> "LanguageServer":
 
         if uri in documents:
             del documents[uri]
+        line_caches.pop(uri, None)
 
         # Clear diagnostics
         server.text_document_publish_diagnostics(
@@ -167,7 +171,7 @@ def create_server() -> "LanguageServer":
 
         if text:
             documents[uri] = text
-            diagnostics = get_diagnostics(text)
+            diagnostics = get_diagnostics(text, line_caches.setdefault(uri, {}))
             server.text_document_publish_diagnostics(
                 types.PublishDiagnosticsParams(uri=uri, diagnostics=diagnostics)
             )
@@ -271,7 +275,7 @@ def create_server() -> "LanguageServer":
                 kind=types.DocumentDiagnosticReportKind.Full, items=[]
             )
 
-        diagnostics = get_diagnostics(text)
+        diagnostics = get_diagnostics(text, line_caches.setdefault(uri, {}))
 
         return types.RelatedFullDocumentDiagnosticReport(
             kind=types.DocumentDiagnosticReportKind.Full, items=diagnostics
@@ -218,6 +218,25 @@ class TestGetCompletions:
         labels = [c.label for c in completions]
         assert "spinel" in labels
 
+    def test_twin_law_completions_filtered_by_prefix(self):
+        """Twin law completions are narrowed to the law being typed."""
+        completions = get_completions("cubic[m3m]:{111}|twin(sp", 24)
+        labels = [c.label for c in completions]
+        assert "spinel" in labels
+        assert all(label.startswith("sp") for label in labels)
+
+    def test_form_completions_filtered_by_prefix(self):
+        """Named form completions are narrowed to the form being typed."""
+        completions = get_completions("cubic[m3m]:oct", 14)
+        labels = [c.label for c in completions]
+        assert labels == ["octahedron", "{"]
+
+    def test_vocabulary_completions_reused(self):
+        """Fixed vocabulary completions are built once and shared."""
+        first = get_completions("cubic[m3m]:{111}|twin(", 22)
+        second = get_completions("cubic[m3m]:{111} | twin(", 24)
+        assert first is second
+
     def test_elongate_param_completions(self):
         """Parameter completions for elongate."""
         completions = get_completions("cubic[m3m]:{111}|elongate(", 26)
@@ -5,7 +5,10 @@ Tests go-to-definition functionality for CDL elements.
 """
 
 from cdl_lsp.features.definition import (
+    _file_uri,
+    _find_line_in_file,
     _get_word_at_position,
+    build_definition_index,
     get_definition,
     get_definitions,
 )
@@ -103,3 +106,86 @@ class TestGetDefinitions:
         """Empty input returns empty list."""
         result = get_definitions("", 0)
         assert result == []
+
+
+class TestFindLineInFile:
+    """Test the cached definition source index."""
+
+    def test_finds_key_inside_dict(self, tmp_path):
+        """Keys are located within the dict that follows the pattern."""
+        source = tmp_path / "constants.py"
+        source.write_text(
+            'OTHER = {\n    "cube": 1,\n}\nNAMED_FORMS = {\n    "cube": (1, 0, 0),\n}\n'
+        )
+        assert _find_line_in_file(str(source), "NAMED_FORMS", "cube") == 4
+        assert _find_line_in_file(str(source), "NAMED_FORMS", "prism") is None
+
+    def test_exact_assignment_name(self, tmp_path):
+        """Patterns match whole assignment names, not substrings."""
+        source = tmp_path / "constants.py"
+        source.write_text(
+            'DEFAULT_POINT_GROUPS = {"cubic": "m3m"}\n'
+            'POINT_GROUPS = {\n    "cubic": {"m3m", "432"},\n}\n'
+        )
+        assert _find_line_in_file(str(source), "POINT_GROUPS", "m3m") == 2
+
+    def test_braces_in_strings(self, tmp_path):
+        """Braces inside strings and comments do not confuse the lookup."""
+        source = tmp_path / "constants.py"
+        source.write_text(
+            'NAMED_FORMS = {\n    "cube": (1, 0, 0),  # {100}\n    "odd}": (1, 1, 1),\n'
+            '    "octahedron": (1, 1, 1),\n}\n'
+        )
+        assert _find_line_in_file(str(source), "NAMED_FORMS", "octahedron") == 3
+
+    def test_case_insensitive_keys(self, tmp_path):
+        """Keys are matched regardless of case."""
+        source = tmp_path / "constants.py"
+        source.write_text('TWIN_LAWS = {\n    "Spinel",\n}\n')
+        assert _find_line_in_file(str(source), "TWIN_LAWS", "spinel") == 1
+        assert _find_line_in_file(str(source), "TWIN_LAWS", "SPINEL") == 1
+
+    def test_index_refreshes_after_edit(self, tmp_path):
+        """Editing the source file invalidates the cached index."""
+        import os
+
+        source = tmp_path / "constants.py"
+        source.write_text('NAMED_FORMS = {\n    "cube": (1, 0, 0),\n}\n')
+        assert _find_line_in_file(str(source), "NAMED_FORMS", "cube") == 1
+        source.write_text('NAMED_FORMS = {\n\n    "cube": (1, 0, 0),\n}\n')
+        stat = source.stat()
+        os.utime(source, (stat.st_atime, stat.st_mtime + 1))
+        assert _find_line_in_file(str(source), "NAMED_FORMS", "cube") == 2
+
+    def test_missing_file(self, tmp_path):
+        """A missing source file yields no location."""
+        assert _find_line_in_file(str(tmp_path / "missing.py"), "NAMED_FORMS", "cube") is None
+
+
+class TestDefinitionIndex:
+    """Test the prebuilt index of built-in definitions."""
+
+    def test_index_is_built_once(self):
+        """Repeated builds return the same index."""
+        assert build_definition_index() is build_definition_index()
+
+    def test_index_covers_definition_results(self):
+        """Built-in definitions resolve to indexed locations."""
+        index = build_definition_index()
+        location = index["forms"].get("octahedron")
+        assert location is not None
+
+        result = get_definition("octahedron", 5)
+        assert result is not None
+        file_path, line = location
+        assert result.uri == _file_uri(file_path)
+        assert result.range.start.line == line
+
+    def test_builtin_locations_are_reused(self):
+        """Repeated lookups of a built-in name return the cached location."""
+        first = get_definition("cubic[m3m]:{111}", 2)
+        assert first is not None
+        file_path, line = build_definition_index()["systems"]["cubic"]
+        assert first.uri == _file_uri(file_path)
+        assert first.range.start.line == line
+        assert first is get_definition("cubic", 3)
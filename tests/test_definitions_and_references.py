@@ -79,6 +79,20 @@ class TestIsOnReference:
         name = _is_on_reference("trigonal[32]:$body | elongate(c:2.0)", 14)
         assert name == "body"
 
+    def test_adjacent_references(self):
+        """Cursor between adjacent references prefers the one on the left."""
+        assert _is_on_reference("$a$b", 2) == "a"
+        assert _is_on_reference("$a$b", 3) == "b"
+
+    def test_bare_dollar_sign(self):
+        """A $ without a name is not a reference."""
+        assert _is_on_reference("$ + $", 0) is None
+        assert _is_on_reference("$$a", 1) == "a"
+
+    def test_cursor_past_end_of_line(self):
+        """Cursor beyond the line is not on a reference."""
+        assert _is_on_reference("$prism", 10) is None
+
 
 class TestFindDocumentDefinitions:
     """Test finding @definitions in document text."""
@@ -400,3 +414,14 @@ class TestDefinitionFormatting:
         """Leading whitespace in definition is preserved."""
         result = format_line("  @prism = {10-10}@1.0")
         assert result == "  @prism = {10-10}@1.0"
+
+    def test_format_plain_line_unchanged(self):
+        """Lines without anything to normalize are returned as-is."""
+        line = "  plain words only"
+        assert format_line(line) is line
+
+    def test_format_plain_line_still_normalized(self):
+        """Case, double spaces and trailing whitespace still bypass the fast path."""
+        assert format_line("Cubic") == "cubic"
+        assert format_line("Twin law") == "twin law"
+        assert format_line("a  b ") == "a b"
@@ -171,6 +171,20 @@ class TestHoverModifications:
         assert "twin" in content.lower()
 
 
+class TestHoverCase:
+    """Tests for case handling in hover lookups."""
+
+    def test_uppercase_system(self):
+        """Crystal system hover is case-insensitive."""
+        hover = get_hover_info("Cubic[m3m]:{111}", 2)
+        assert hover is not None
+
+    def test_uppercase_point_group(self):
+        """Point group hover is case-sensitive."""
+        hover = get_hover_info("cubic[M3M]:{111}", 7)
+        assert hover is None
+
+
 class TestHoverNoResult:
     """Tests for cases where no hover should be returned."""
 
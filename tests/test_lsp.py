@@ -65,12 +65,79 @@ class TestConstants:
         assert "truncate" in MODIFICATIONS
         assert "twin" in MODIFICATIONS
 
+    def test_lookup_tables_are_immutable(self):
+        """Test lookup tables cannot be mutated across requests."""
+        assert isinstance(CRYSTAL_SYSTEMS, frozenset)
+        assert isinstance(ALL_POINT_GROUPS, frozenset)
+        assert isinstance(TWIN_LAWS, frozenset)
+        assert isinstance(MODIFICATIONS, frozenset)
+        assert isinstance(POINT_GROUPS["cubic"], frozenset)
+        with pytest.raises(TypeError):
+            POINT_GROUPS["cubic"] = frozenset()
+        with pytest.raises(TypeError):
+            NAMED_FORMS["cube"] = (0, 0, 0)
+
+    def test_form_miller_indices_lookup(self):
+        """Test named form lookup is case-insensitive."""
+        from cdl_lsp.constants import get_form_miller_indices
+
+        assert get_form_miller_indices("octahedron") == (1, 1, 1)
+        assert get_form_miller_indices("Octahedron") == (1, 1, 1)
+        assert get_form_miller_indices("not_a_form") is None
+
+    def test_point_group_to_system(self):
+        """Test every point group maps back to its system."""
+        from cdl_lsp.constants import (
+            get_system_for_point_group,
+            validate_point_group_for_system,
+        )
+
+        for system, groups in POINT_GROUPS.items():
+            for pg in groups:
+                assert get_system_for_point_group(pg) == system
+                assert validate_point_group_for_system(system, pg)
+        assert get_system_for_point_group("xyz") is None
+        assert not validate_point_group_for_system("cubic", "6/mmm")
+
+    def test_validators_are_case_insensitive(self):
+        """Test is_valid_* helpers normalise case before lookup."""
+        from cdl_lsp.constants import (
+            is_valid_arrangement,
+            is_valid_point_group,
+            is_valid_system,
+            is_valid_twin_law,
+        )
+
+        assert is_valid_system("Cubic")
+        assert is_valid_system("CUBIC")
+        assert is_valid_twin_law("Spinel")
+        assert is_valid_arrangement("Parallel")
+        assert not is_valid_system("cubik")
+        # Point groups are case-sensitive
+        assert is_valid_point_group("m3m")
+        assert not is_valid_point_group("M3M")
+
     def test_system_docs(self):
         """Test system documentation exists."""
         for system in CRYSTAL_SYSTEMS:
             assert system in SYSTEM_DOCS
             assert len(SYSTEM_DOCS[system]) > 0
 
+    def test_twin_law_doc_aliases_shared(self):
+        """Test alias twin-law names share a single doc string."""
+        from cdl_lsp.constants import TWIN_LAW_DOCS
+
+        assert TWIN_LAW_DOCS["spinel"] is TWIN_LAW_DOCS["spinel_law"]
+
+    def test_lazy_doc_tables(self):
+        """Test documentation tables resolve through the constants module."""
+        from cdl_lsp import _docs, constants
+
+        assert constants.FORM_DOCS is _docs.FORM_DOCS
+        assert "NESTED_GROWTH_DOCS" in dir(constants)
+        with pytest.raises(AttributeError):
+            constants.NOT_A_TABLE  # noqa: B018
+
     def test_point_group_docs(self):
         """Test point group documentation exists."""
         for pg in ["m3m", "6/mmm", "-3m", "4/mmm", "mmm", "2/m", "-1"]:
@@ -172,6 +239,20 @@ class TestDiagnostics:
         diagnostics = get_diagnostics("cubic[xyz]:{111}")
         assert len(diagnostics) > 0
 
+    def test_changed_lines_match_full_validation(self):
+        """Test incremental revalidation reuses cached lines at their new positions."""
+        from cdl_lsp.features import validate_changed_lines, validate_document
+
+        line_cache: dict = {}
+        text = "cubic[xyz]:{111}\ninvalid[m3m]:{111}"
+        assert validate_changed_lines(text, line_cache) == validate_document(text)
+
+        # Inserting a line shifts the cached diagnostics of the lines below it
+        text = "cubic[m3m]:{111}\n" + text
+        diagnostics = validate_changed_lines(text, line_cache)
+        assert diagnostics == validate_document(text)
+        assert {d.line for d in diagnostics} == {1, 2}
+
 
 # =============================================================================
 # Completion Tests
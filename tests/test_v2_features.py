@@ -5,6 +5,7 @@ Tests completion, diagnostics, go-to-definition, document symbols,
 and formatting for CDL v2.0 syntax.
 """
 
+from cdl_lsp._line_cache import parse_line
 from cdl_lsp.features.completion import (
     CompletionContext,
     _detect_context,
@@ -47,7 +48,7 @@ class TestAmorphousSubtypeCompletion:
     def test_amorphous_subtype_completions(self):
         """Get completions for amorphous subtypes."""
         completions = get_completions("amorphous[", 10)
-        labels = [c.label if hasattr(c, "label") else c["label"] for c in completions]
+        labels = [c.label for c in completions]
         assert "opalescent" in labels
         assert "glassy" in labels
         assert "waxy" in labels
@@ -57,7 +58,7 @@ class TestAmorphousSubtypeCompletion:
     def test_amorphous_subtype_filtered(self):
         """Filtered completions for amorphous subtypes."""
         completions = get_completions("amorphous[gl", 12)
-        labels = [c.label if hasattr(c, "label") else c["label"] for c in completions]
+        labels = [c.label for c in completions]
         assert "glassy" in labels
         assert "opalescent" not in labels
 
@@ -80,7 +81,7 @@ class TestAmorphousShapeCompletion:
     def test_amorphous_shape_completions(self):
         """Get completions for amorphous shapes."""
         completions = get_completions("amorphous[opalescent]:{", 23)
-        labels = [c.label if hasattr(c, "label") else c["label"] for c in completions]
+        labels = [c.label for c in completions]
         assert "massive" in labels
         assert "botryoidal" in labels
         assert "nodular" in labels
@@ -104,7 +105,7 @@ class TestArrangementTypeCompletion:
     def test_arrangement_completions(self):
         """Get completions for arrangement types."""
         completions = get_completions("cubic[m3m]:{111} ~ ", 19)
-        labels = [c.label if hasattr(c, "label") else c["label"] for c in completions]
+        labels = [c.label for c in completions]
         assert "parallel" in labels
         assert "random" in labels
         assert "radial" in labels
@@ -125,7 +126,7 @@ class TestAggregateOrientationCompletion:
     def test_orientation_completions(self):
         """Get completions for orientations."""
         completions = get_completions("cubic[m3m]:{111} ~ parallel[20] [", 33)
-        labels = [c.label if hasattr(c, "label") else c["label"] for c in completions]
+        labels = [c.label for c in completions]
         assert "aligned" in labels
         assert "random" in labels
         assert "planar" in labels
@@ -138,14 +139,14 @@ class TestAmorphousInEmptyContext:
     def test_amorphous_offered_on_empty(self):
         """amorphous should appear alongside crystal systems."""
         completions = get_completions("", 0)
-        labels = [c.label if hasattr(c, "label") else c["label"] for c in completions]
+        labels = [c.label for c in completions]
         assert "amorphous" in labels
         assert "cubic" in labels
 
     def test_amorphous_filtered_by_prefix(self):
         """Typing 'am' should offer amorphous."""
         completions = get_completions("am", 2)
-        labels = [c.label if hasattr(c, "label") else c["label"] for c in completions]
+        labels = [c.label for c in completions]
         assert "amorphous" in labels
 
 
@@ -230,6 +231,29 @@ class TestAggregateCountDiagnostics:
         assert diags[0].code == "aggregate-count-large"
 
 
+class TestParseLine:
+    """Test the shared scan of v2.0 constructs."""
+
+    def test_amorphous_and_operators(self):
+        """Subtype, shapes and operators are found with their positions."""
+        parsed = parse_line("amorphous[opalescent]:{massive} > {1} ~ parallel[20]")
+        assert (parsed.subtype, parsed.subtype_start) == ("opalescent", 10)
+        assert (parsed.shapes, parsed.shapes_start) == ("massive", 23)
+        nested, aggregate = parsed.operators
+        assert nested.arrangement is None
+        assert (aggregate.arrangement, aggregate.count) == ("parallel", "20")
+
+    def test_aggregate_without_count(self):
+        """An arrangement without a count is still reported."""
+        (operator,) = parse_line("{111} ~ parallel[").operators
+        assert operator.arrangement == "parallel"
+        assert operator.count is None
+
+    def test_cached_per_line(self):
+        """Repeated scans of the same line reuse the cached result."""
+        assert parse_line("{111} ~ parallel[20]") is parse_line("{111} ~ parallel[20]")
+
+
 # =============================================================================
 # L4: Go-to-Definition Tests
 # =============================================================================